@@ -5,63 +5,142 @@
 @description: Collection of productivity custom nodes for ComfyUI workflows
 """
 
+import os
 import sys
-import importlib.util
 import json
-import subprocess
 from pathlib import Path
 
 # Import version information
 from .version import __version__, VERSION, BASE_VERSION, PIP_VERSION
 
+# Paths resolved once at import; kept as strings for the os.path hot paths
+_CURRENT = os.path.dirname(os.path.abspath(__file__))
+_NODES = os.path.join(_CURRENT, "nodes")
+_SYNC_SCRIPT = os.path.join(_CURRENT, "scripts", "sync_web_files.py")
+
+# Path views of the same locations, for helpers that use the pathlib API
+_HERE = Path(_CURRENT)
+_NODES_DIR = Path(_NODES)
+
+# Informational startup output is opt-in; warnings and errors always print
+_VERBOSE = os.environ.get("DAZZLENODES_VERBOSE", "").lower() in ("1", "true", "yes")
+
 # ============================================================================
 # Auto-sync web resources
 # ============================================================================
-def _sync_web_resources():
-    """Sync web resources from submodules and core nodes to web/ directory."""
-    sync_script = Path(__file__).parent / "scripts" / "sync_web_files.py"
+_SYNC_STAMP_FILE = ".sync_stamp"
+_SYNC_MODULE_NAME = "_dazzle_sync"
 
-    print("[DazzleNodes] Starting web resource sync...")
-    print(f"[DazzleNodes] Sync script path: {sync_script}")
-    print(f"[DazzleNodes] Sync script exists: {sync_script.exists()}")
 
-    if not sync_script.exists():
-        print(f"[DazzleNodes] ERROR: sync_web_files.py not found at {sync_script}")
-        return
+def _newest_web_source_mtime(base_dir):
+    """Return the newest st_mtime_ns across everything the web sync reads.
+
+    Covers web_src/core/, every nodes/*/web/ and core_nodes/*/web/ tree
+    (files and directories, so deletions count too), the parent node
+    directories themselves, and the sync script.
+    """
+    newest = 0
+    roots = [os.path.join(base_dir, "web_src", "core")]
+    stat_only = [os.path.join(base_dir, "scripts", "sync_web_files.py")]
+
+    for parent in ("nodes", "core_nodes"):
+        parent_dir = os.path.join(base_dir, parent)
+        stat_only.append(parent_dir)
+        try:
+            with os.scandir(parent_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        roots.append(os.path.join(entry.path, "web"))
+        except OSError:
+            continue
+
+    for path in stat_only + roots:
+        try:
+            newest = max(newest, os.stat(path).st_mtime_ns)
+        except OSError:
+            pass
+
+    stack = roots
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    pass
+
+    return newest
 
+
+def _read_sync_stamp(stamp_path):
+    """Return the mtime recorded by the last successful sync (0 if unknown)."""
     try:
-        print(f"[DazzleNodes] Executing: {sys.executable} {sync_script}")
-        result = subprocess.run(
-            [sys.executable, str(sync_script)],  # Removed --quiet to see output
-            capture_output=True,
-            text=True,
-            timeout=30,  # Increased from 10s
-            check=False,
-            cwd=Path(__file__).parent  # CRITICAL: Set working directory to DazzleNodes directory
-        )
+        with open(stamp_path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return 0
+
 
-        # Always show stdout
-        if result.stdout:
-            print("[DazzleNodes] Sync output:")
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    print(f"[DazzleNodes]   {line}")
+def _sync_web_resources():
+    """Sync web resources from submodules and core nodes to web/ directory.
+
+    Skipped entirely when nothing the sync reads has changed since the last
+    successful run (tracked in web/.sync_stamp). No stamp is written while a
+    background submodule update is still populating nodes/, so a sync of the
+    half-initialised tree is never mistaken for an up-to-date one.
+    """
+    stamp_path = os.path.join(_CURRENT, "web", _SYNC_STAMP_FILE)
+    newest = _newest_web_source_mtime(_CURRENT)
+    if newest and newest == _read_sync_stamp(stamp_path):
+        return
+
+    if _VERBOSE:
+        print("[DazzleNodes] Starting web resource sync...")
+        print(f"[DazzleNodes] Sync script path: {_SYNC_SCRIPT}")
+
+    if not os.path.isfile(_SYNC_SCRIPT):
+        print(f"[DazzleNodes] ERROR: sync_web_files.py not found at {_SYNC_SCRIPT}")
+        return
 
-        # Check result
-        if result.returncode == 0:
+    try:
+        # Run the sync in-process: importing the script is far cheaper than
+        # starting a second interpreter, and the module is cached for reuse.
+        sync_module = sys.modules.get(_SYNC_MODULE_NAME)
+        if sync_module is None:
+            import importlib.util
+            spec = importlib.util.spec_from_file_location(_SYNC_MODULE_NAME, _SYNC_SCRIPT)
+            sync_module = importlib.util.module_from_spec(spec)
+            sys.modules[_SYNC_MODULE_NAME] = sync_module
+            try:
+                spec.loader.exec_module(sync_module)
+            except BaseException:
+                del sys.modules[_SYNC_MODULE_NAME]
+                raise
+
+        stats = sync_module.sync_web_files(quiet=not _VERBOSE)
+
+        # Failed copies were already reported by the sync; leaving the stamp
+        # unwritten makes the next import run it again
+        if stats.get("failed"):
+            return
+        if _VERBOSE:
             print("[DazzleNodes] [OK] Web resource sync completed successfully")
-        else:
-            print(f"[DazzleNodes] [FAIL] Web sync failed with exit code {result.returncode}")
-            if result.stderr:
-                print(f"[DazzleNodes] Error output:")
-                for line in result.stderr.strip().split('\n'):
-                    if line:
-                        print(f"[DazzleNodes]   {line}")
-
-    except subprocess.TimeoutExpired:
-        print("[DazzleNodes] ERROR: Web sync timed out after 30 seconds")
+        if _pending_submodules:
+            return
+        try:
+            with open(stamp_path, "w") as f:
+                f.write(f"{newest}\n")
+        except OSError as e:
+            print(f"[DazzleNodes] [WARN] Could not write {_SYNC_STAMP_FILE}: {e}")
+
     except Exception as e:
-        print(f"[DazzleNodes] ERROR: Web sync exception: {type(e).__name__}: {e}")
+        print(f"[DazzleNodes] [FAIL] Web sync exception: {type(e).__name__}: {e}")
 
 # ============================================================================
 # Auto-initialize empty submodules (e.g., after ComfyUI Manager install)
@@ -69,24 +148,23 @@ def _sync_web_resources():
 def _find_empty_submodule_dirs(nodes_dir):
     """Return list of submodule directory names that are empty or contain only .git file."""
     empty = []
-    for child in nodes_dir.iterdir():
-        if not child.is_dir():
-            continue
-        # Skip symlinks/junctions (dev mode)
-        try:
-            if child.is_symlink() or child.is_junction():
+    with os.scandir(nodes_dir) as it:
+        for entry in it:
+            # Skip symlinks (dev mode) and non-directories; DirEntry answers
+            # both from the directory listing without an extra stat
+            if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
                 continue
-        except AttributeError:
-            # is_junction() added in Python 3.12
-            if child.is_symlink():
+            # Skip junctions (dev mode) — DirEntry.is_junction() added in Python 3.12
+            is_junction = getattr(entry, "is_junction", None)
+            if is_junction is not None and is_junction():
                 continue
-        # Skip disabled nodes (set by dev_mode.py disable command)
-        if (child / "DISABLED").exists():
-            continue
-        # Check if directory is empty (or only contains .git file)
-        contents = list(child.iterdir())
-        if len(contents) == 0 or (len(contents) == 1 and contents[0].name == ".git"):
-            empty.append(child.name)
+            # Check if directory is empty (or only contains .git file). Reads at
+            # most two entries; disabled nodes always contain their DISABLED
+            # marker, so they are never reported.
+            with os.scandir(entry.path) as children:
+                first = next(children, None)
+                if first is None or (first.name == ".git" and next(children, None) is None):
+                    empty.append(entry.name)
     return empty
 
 
@@ -132,6 +210,8 @@ def _clone_submodules_fallback(base_dir, empty_submodules):
     Used when installed from a tarball/registry (no .git directory).
     Reads URLs from .gitmodules and pinned versions from submodule_versions.json.
     """
+    import subprocess
+
     modules = _parse_gitmodules(base_dir)
     versions = _load_submodule_versions(base_dir)
 
@@ -170,7 +250,8 @@ def _clone_submodules_fallback(base_dir, empty_submodules):
 
             result = subprocess.run(
                 clone_cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # Only stderr is reported
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=120
             )
@@ -201,187 +282,337 @@ def _clone_submodules_fallback(base_dir, empty_submodules):
     return fail_count == 0
 
 
+_SUBMODULES_MARKER = _HERE / ".dazzle_submodules_ok"
+
+
+def _submodules_marker_is_fresh():
+    """Return True if the submodules were verified populated since .gitmodules
+    or the nodes/ listing last changed."""
+    try:
+        marker_mtime = _SUBMODULES_MARKER.stat().st_mtime_ns
+        if marker_mtime <= _NODES_DIR.stat().st_mtime_ns:
+            return False
+    except OSError:
+        return False
+    try:
+        return marker_mtime > (_HERE / ".gitmodules").stat().st_mtime_ns
+    except OSError:
+        return True
+
+
+def _mark_submodules_ok():
+    """Record that every submodule directory is populated."""
+    try:
+        _SUBMODULES_MARKER.touch()
+    except OSError as e:
+        print(f"[DazzleNodes] [WARN] Could not write {_SUBMODULES_MARKER.name}: {e}")
+
+
+def _clear_submodules_marker():
+    """Force the next import to rescan for empty submodule directories.
+
+    The marker's freshness check can't see a pack directory being emptied
+    (e.g. by 'git submodule deinit'), so a pack found without files drops it.
+    """
+    try:
+        _SUBMODULES_MARKER.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[DazzleNodes] [WARN] Could not remove {_SUBMODULES_MARKER.name}: {e}")
+
+
+# Background 'git submodule update' started at import time, and the submodule
+# directories it is populating; both are settled by _finish_submodule_init()
+_pending_git = None
+_pending_submodules = frozenset()
+
+
 def _init_submodules_if_needed():
     """Initialize git submodules if directories exist but are empty.
 
     Skips symlinks/junctions (dev mode) and directories that already have content.
+    Once every directory is populated, .dazzle_submodules_ok is written and the
+    scan is skipped on later imports until .gitmodules or nodes/ changes.
 
     Strategy:
-    1. Try git submodule update (works for git clone installs)
+    1. Start git submodule update in the background (works for git clone installs)
     2. Re-check if dirs are still empty (catches silent failures)
     3. Fall back to direct git clone from .gitmodules + submodule_versions.json
        (works for tarball/registry installs without .git directory)
+
+    Steps 2 and 3 run in _finish_submodule_init(), called before the affected
+    packs are loaded, so populated packs load while git is still working.
     """
-    base_dir = Path(__file__).parent
-    nodes_dir = base_dir / "nodes"
-    if not nodes_dir.exists():
+    global _pending_git, _pending_submodules
+
+    if _submodules_marker_is_fresh() or not _NODES_DIR.exists():
         return
 
-    empty_submodules = _find_empty_submodule_dirs(nodes_dir)
+    empty_submodules = _find_empty_submodule_dirs(_NODES_DIR)
     if not empty_submodules:
+        _mark_submodules_ok()
         return
 
     print(f"[DazzleNodes] Empty submodule directories detected: {', '.join(empty_submodules)}")
+    _pending_submodules = frozenset(empty_submodules)
+
+    # Imported here so the common already-initialised path never pays for it
+    import subprocess
 
     # Step 1: Try standard git submodule update
     print("[DazzleNodes] Running git submodule update --init --recursive...")
     try:
-        result = subprocess.run(
+        _pending_git = subprocess.Popen(
             ["git", "submodule", "update", "--init", "--recursive"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,  # Only stderr is reported
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=120,
-            cwd=base_dir
+            cwd=_HERE
         )
-        if result.returncode != 0:
-            print(f"[DazzleNodes] [WARN] Submodule init exited with code {result.returncode}")
-            if result.stderr:
-                for line in result.stderr.strip().split('\n'):
-                    if line:
-                        print(f"[DazzleNodes]   {line}")
-    except subprocess.TimeoutExpired:
-        print("[DazzleNodes] [WARN] Submodule init timed out after 120 seconds")
     except FileNotFoundError:
         print("[DazzleNodes] [WARN] git not found — will try direct clone fallback")
     except Exception as e:
         print(f"[DazzleNodes] [WARN] Submodule init failed: {e}")
 
+
+def _finish_submodule_init():
+    """Wait for the background submodule update, then fall back to cloning.
+
+    No-op unless _init_submodules_if_needed() found empty directories.
+    """
+    global _pending_git, _pending_submodules
+
+    if not _pending_submodules:
+        return
+    proc, _pending_git = _pending_git, None
+    _pending_submodules = frozenset()
+
+    import subprocess
+
+    if proc is not None:
+        try:
+            _, stderr = proc.communicate(timeout=120)
+            if proc.returncode != 0:
+                print(f"[DazzleNodes] [WARN] Submodule init exited with code {proc.returncode}")
+                if stderr:
+                    for line in stderr.strip().split('\n'):
+                        if line:
+                            print(f"[DazzleNodes]   {line}")
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            print("[DazzleNodes] [WARN] Submodule init timed out after 120 seconds")
+
     # Step 2: Re-check if directories are still empty
-    still_empty = _find_empty_submodule_dirs(nodes_dir)
+    still_empty = _find_empty_submodule_dirs(_NODES_DIR)
     if not still_empty:
         print("[DazzleNodes] [OK] Submodules initialized successfully")
-        return
+        _mark_submodules_ok()
+    else:
+        # Step 3: Fallback — clone directly from .gitmodules URLs
+        print(f"[DazzleNodes] Submodule update did not populate: {', '.join(still_empty)}")
+        print("[DazzleNodes] Attempting direct clone fallback (registry/tarball install)...")
+        if _clone_submodules_fallback(_HERE, still_empty):
+            _mark_submodules_ok()
 
-    # Step 3: Fallback — clone directly from .gitmodules URLs
-    print(f"[DazzleNodes] Submodule update did not populate: {', '.join(still_empty)}")
-    print("[DazzleNodes] Attempting direct clone fallback (registry/tarball install)...")
-    _clone_submodules_fallback(base_dir, still_empty)
+    # The import-time web sync ran before these packs had any files
+    _sync_web_resources()
 
 _init_submodules_if_needed()
 
 # Run auto-sync before loading nodes
 _sync_web_resources()
 
-# Initialize aggregator dictionaries
-NODE_CLASS_MAPPINGS = {}
-NODE_DISPLAY_NAME_MAPPINGS = {}
+# Node packs bundled in nodes/ as (directory name, display name).
+# Adding a pack is a one-line change here.
+_PACKS = (
+    ("smart-resolution-calc", "Smart Resolution Calculator"),
+    ("fit-mask-to-image", "Fit Mask to Image"),
+    ("dazzle-comfy-plasma-fast", "Plasma Noise Generators"),
+    ("preview-bridge-extended", "Preview Bridge Extended"),
+    ("dazzle-switch", "Dazzle Switch"),
+    ("dazzle-command", "Dazzle Command"),
+)
+
 _loaded_nodes = []
 _failed_nodes = []
 
-print("[DazzleNodes] Loading node collection...")
+# Per-process cache of loaded packs: node_dir_name -> (class mappings, display mappings)
+_module_cache = {}
 
-# Current directory
-_current_dir = Path(__file__).parent
-_nodes_dir = _current_dir / "nodes"
+_EMPTY_PACK = ({}, {})
 
-# Helper function to load a node module from directory with hyphens
-def load_node_module(node_dir_name, display_name):
-    """Load a node module from a directory (even with hyphens in name)"""
-    node_path = _nodes_dir / node_dir_name
+
+def _load_pack(node_dir_name, display_name):
+    """Load one pack and return its (class mappings, display mappings).
+
+    Packs already loaded in this process are served from _module_cache, and
+    a module already present in sys.modules (from the same __init__.py) is
+    reused instead of being executed a second time. Disabled packs return
+    empty mappings.
+    """
+    node_path = os.path.join(_NODES, node_dir_name)
 
     # Check for DISABLED marker (set by dev_mode.py disable command)
-    if (node_path / "DISABLED").exists():
-        print(f"[DazzleNodes] {display_name} is DISABLED (skipping)")
-        return 0
+    if os.path.exists(os.path.join(node_path, "DISABLED")):
+        if _VERBOSE:
+            print(f"[DazzleNodes] {display_name} is DISABLED (skipping)")
+        return _EMPTY_PACK
 
-    init_file = node_path / "__init__.py"
+    cached = _module_cache.get(node_dir_name)
+    if cached is not None:
+        return cached
 
-    if not init_file.exists():
+    init_file = os.path.join(node_path, "__init__.py")
+
+    if not os.path.isfile(init_file):
+        # Missing or emptied submodule: let the next import re-initialise it
+        _clear_submodules_marker()
         raise FileNotFoundError(f"__init__.py not found in {node_path}")
 
-    # Load the module using importlib
-    spec = importlib.util.spec_from_file_location(
-        node_dir_name.replace("-", "_"),  # Module name (replace hyphens)
-        init_file
-    )
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
+    module_name = node_dir_name.replace("-", "_")  # Module name (replace hyphens)
+    module = sys.modules.get(module_name)
+    if module is None or getattr(module, "__file__", None) != init_file:
+        # Load the module using importlib
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(module_name, init_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Don't leave a half-initialised module for the next attempt to reuse
+            sys.modules.pop(spec.name, None)
+            raise
 
     # Extract NODE_CLASS_MAPPINGS and NODE_DISPLAY_NAME_MAPPINGS
-    if hasattr(module, 'NODE_CLASS_MAPPINGS'):
-        NODE_CLASS_MAPPINGS.update(module.NODE_CLASS_MAPPINGS)
-    else:
+    class_mappings = getattr(module, 'NODE_CLASS_MAPPINGS', None)
+    if class_mappings is None:
         raise AttributeError(f"Module {node_dir_name} has no NODE_CLASS_MAPPINGS")
 
-    if hasattr(module, 'NODE_DISPLAY_NAME_MAPPINGS'):
-        NODE_DISPLAY_NAME_MAPPINGS.update(module.NODE_DISPLAY_NAME_MAPPINGS)
+    display_mappings = getattr(module, 'NODE_DISPLAY_NAME_MAPPINGS', None)
+    if display_mappings is None:
+        display_mappings = {}
 
-    return len(module.NODE_CLASS_MAPPINGS)
+    cached = (class_mappings, display_mappings)
+    _module_cache[node_dir_name] = cached
+    return cached
 
-# ============================================================================
-# Load Smart Resolution Calculator
-# ============================================================================
-try:
-    num_nodes = load_node_module("smart-resolution-calc", "Smart Resolution Calculator")
-    _loaded_nodes.append(f"Smart Resolution Calculator ({num_nodes} nodes)")
-except Exception as e:
-    _failed_nodes.append(("Smart Resolution Calculator", str(e)))
-    print(f"[DazzleNodes] [WARN] Could not load Smart Resolution Calculator: {e}")
 
-# ============================================================================
-# Load Fit Mask to Image
-# ============================================================================
-try:
-    num_nodes = load_node_module("fit-mask-to-image", "Fit Mask to Image")
-    _loaded_nodes.append(f"Fit Mask to Image ({num_nodes} nodes)")
-except Exception as e:
-    _failed_nodes.append(("Fit Mask to Image", str(e)))
-    print(f"[DazzleNodes] [WARN] Could not load Fit Mask to Image: {e}")
+# Helper function to load a node module from directory with hyphens
+def load_node_module(node_dir_name, display_name):
+    """Load a node module from a directory (even with hyphens in name)
 
-# ============================================================================
-# Load Plasma Noise Generators
-# ============================================================================
-try:
-    num_nodes = load_node_module("dazzle-comfy-plasma-fast", "Plasma Noise Generators")
-    _loaded_nodes.append(f"Plasma Noise Generators ({num_nodes} nodes)")
-except Exception as e:
-    _failed_nodes.append(("Plasma Noise Generators", str(e)))
-    print(f"[DazzleNodes] [WARN] Could not load Plasma Noise Generators: {e}")
+    Merges the pack's mappings into the collection and returns its node count.
+    The collection itself is loaded first if nothing has read it yet.
+    """
+    _ensure_node_packs_loaded()
+    class_mappings, display_mappings = _load_pack(node_dir_name, display_name)
+    NODE_CLASS_MAPPINGS.update(class_mappings)
+    NODE_DISPLAY_NAME_MAPPINGS.update(display_mappings)
+    return len(class_mappings)
 
-# ============================================================================
-# Load Preview Bridge Extended
-# ============================================================================
-try:
-    num_nodes = load_node_module("preview-bridge-extended", "Preview Bridge Extended")
-    _loaded_nodes.append(f"Preview Bridge Extended ({num_nodes} nodes)")
-except Exception as e:
-    _failed_nodes.append(("Preview Bridge Extended", str(e)))
-    print(f"[DazzleNodes] [WARN] Could not load Preview Bridge Extended: {e}")
 
-# ============================================================================
-# Load Dazzle Switch
-# ============================================================================
-try:
-    num_nodes = load_node_module("dazzle-switch", "Dazzle Switch")
-    _loaded_nodes.append(f"Dazzle Switch ({num_nodes} nodes)")
-except Exception as e:
-    _failed_nodes.append(("Dazzle Switch", str(e)))
-    print(f"[DazzleNodes] [WARN] Could not load Dazzle Switch: {e}")
+def _load_node_packs():
+    """Load every pack in _PACKS and publish the aggregated mappings.
 
-# ============================================================================
-try:
-    num_nodes = load_node_module("dazzle-command", "Dazzle Command")
-    _loaded_nodes.append(f"Dazzle Command ({num_nodes} nodes)")
-except Exception as e:
-    _failed_nodes.append(("Dazzle Command", str(e)))
-    print(f"[DazzleNodes] [WARN] Could not load Dazzle Command: {e}")
+    Runs once, on first access to NODE_CLASS_MAPPINGS or
+    NODE_DISPLAY_NAME_MAPPINGS (see __getattr__ below).
+    """
+    global NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS
 
-# ============================================================================
-# Report Loading Status
-# ============================================================================
-if _loaded_nodes:
-    print(f"[DazzleNodes] [OK] Loaded {len(_loaded_nodes)} nodes: {', '.join(_loaded_nodes)}")
-    print(f"[DazzleNodes] [OK] {len(NODE_CLASS_MAPPINGS)} node(s) available")
-
-if _failed_nodes:
-    print(f"[DazzleNodes] [WARN] Failed to load {len(_failed_nodes)} nodes:")
-    for node_name, error in _failed_nodes:
-        print(f"[DazzleNodes]    - {node_name}: {error}")
-
-if not _loaded_nodes:
-    print("[DazzleNodes] [FAIL] No nodes loaded! Check submodule initialization.")
-    print("[DazzleNodes]    Run: git submodule update --init --recursive")
+    # Bind the globals before loading so later lookups bypass __getattr__
+    NODE_CLASS_MAPPINGS = {}
+    NODE_DISPLAY_NAME_MAPPINGS = {}
+    try:
+        _load_and_merge_packs()
+    except BaseException:
+        # Unbind again so the next access retries instead of seeing a
+        # partial collection for the rest of the process
+        del NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS
+        _loaded_nodes.clear()
+        _failed_nodes.clear()
+        raise
+
+
+def _load_and_merge_packs():
+    """Load the packs into the already-bound mapping globals and report status."""
+    if _VERBOSE:
+        print("[DazzleNodes] Loading node collection...")
+
+    # Packs are executed one at a time: their __init__s import shared
+    # dependencies (torch, PIL, comfy.*) with import-time side effects, which
+    # is not safe to run concurrently. Packs already on disk load while any
+    # background submodule init is still running; the packs it populates
+    # load after it settles. Results are collected in _PACKS order.
+    results = {}
+
+    def load(node_dir_name, display_name):
+        try:
+            results[node_dir_name] = _load_pack(node_dir_name, display_name)
+        except Exception as e:
+            results[node_dir_name] = e
+
+    for node_dir_name, display_name in _PACKS:
+        if node_dir_name not in _pending_submodules:
+            load(node_dir_name, display_name)
+    _finish_submodule_init()
+    for node_dir_name, display_name in _PACKS:
+        if node_dir_name not in results:
+            load(node_dir_name, display_name)
+
+    pack_results = []
+    for node_dir_name, display_name in _PACKS:
+        result = results[node_dir_name]
+        if isinstance(result, Exception):
+            _failed_nodes.append((display_name, str(result)))
+            print(f"[DazzleNodes] [WARN] Could not load {display_name}: {result}")
+            continue
+        pack_results.append(result)
+        _loaded_nodes.append(f"{display_name} ({len(result[0])} nodes)")
+
+    # Merge once, in _PACKS order, so the result (including which pack
+    # wins a name clash) is deterministic
+    for class_mappings, display_mappings in pack_results:
+        NODE_CLASS_MAPPINGS.update(class_mappings)
+        NODE_DISPLAY_NAME_MAPPINGS.update(display_mappings)
+
+    # ========================================================================
+    # Report Loading Status
+    # ========================================================================
+    if _loaded_nodes:
+        print(f"[DazzleNodes] [OK] Loaded {len(_loaded_nodes)} nodes: {', '.join(_loaded_nodes)}")
+        if _VERBOSE:
+            print(f"[DazzleNodes] [OK] {len(NODE_CLASS_MAPPINGS)} node(s) available")
+
+    if _failed_nodes:
+        print(f"[DazzleNodes] [WARN] Failed to load {len(_failed_nodes)} nodes:")
+        for node_name, error in _failed_nodes:
+            print(f"[DazzleNodes]    - {node_name}: {error}")
+
+    if not _loaded_nodes:
+        print("[DazzleNodes] [FAIL] No nodes loaded! Check submodule initialization.")
+        print("[DazzleNodes]    Run: git submodule update --init --recursive")
+
+
+def _ensure_node_packs_loaded():
+    """Run _load_node_packs() unless the mappings are already bound."""
+    if "NODE_CLASS_MAPPINGS" not in globals():
+        _load_node_packs()
+
+
+def __getattr__(name):
+    """Load node packs lazily, on first access to the mappings (PEP 562).
+
+    Importing DazzleNodes only syncs web resources; the packs themselves
+    (and their numpy/torch/PIL imports) are executed when ComfyUI first
+    reads NODE_CLASS_MAPPINGS or NODE_DISPLAY_NAME_MAPPINGS.
+    """
+    if name in ("NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS"):
+        _ensure_node_packs_loaded()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Web directory for JavaScript widgets
 WEB_DIRECTORY = "./web"
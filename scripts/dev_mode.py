@@ -23,7 +23,9 @@ from pathlib import Path
 from datetime import datetime
 import shutil
 import os
+import stat
 import configparser
+from collections import namedtuple
 
 # Try to import yaml with helpful error message
 try:
@@ -52,6 +54,12 @@ DEFAULT_CONFIG = {
 # Local mappings file (not committed to git)
 LOCAL_MAPPINGS_FILE = "dev_mode_local.yaml"
 
+# Computed once: scripts/ and the DazzleNodes root above it. abspath, not
+# resolve(): when DazzleNodes is symlinked into custom_nodes/, root.parent
+# must stay custom_nodes/ rather than the checkout's real parent.
+_SCRIPT_DIR = Path(os.path.abspath(__file__)).parent
+_DAZZLENODES_ROOT = _SCRIPT_DIR.parent
+
 # ============================================================================
 # Configuration Loading
 # ============================================================================
@@ -61,7 +69,7 @@ def load_config():
     config = DEFAULT_CONFIG.copy()
 
     # Try to load config file
-    config_file = Path(__file__).parent / "dev_mode_config.yaml"
+    config_file = _SCRIPT_DIR / "dev_mode_config.yaml"
     if config_file.exists():
         try:
             with open(config_file, 'r') as f:
@@ -84,8 +92,7 @@ def load_config():
 
 def get_dazzlenodes_root():
     """Get the DazzleNodes root directory."""
-    script_dir = Path(__file__).parent
-    return script_dir.parent
+    return _DAZZLENODES_ROOT
 
 def _get_submodule_version(root, node_name):
     """Read version for a node from submodule_versions.json.
@@ -144,6 +151,7 @@ def create_standalone_link(target_path, link_path, verbose=False):
         else:
             # Unix: use symlink
             link_path.symlink_to(target_path)
+        _forget_symlink(link_path)
 
         if verbose:
             print(f"  Created link: {link_path} -> {target_path}")
@@ -173,6 +181,7 @@ def remove_standalone_link(link_path, verbose=False):
             os.rmdir(str(link_path))
         else:
             link_path.unlink()
+        _forget_symlink(link_path)
         if verbose:
             print(f"  Removed standalone link: {link_path}")
         return True
@@ -181,6 +190,27 @@ def remove_standalone_link(link_path, verbose=False):
         return False
 
 
+def _select_nodes(node_arg, node_mappings):
+    """
+    Resolve a node argument ('all' or a node name) against known nodes.
+
+    Args:
+        node_arg: Value of the command's node argument
+        node_mappings: dict of node_name -> source path
+
+    Returns:
+        list: Node names to process, or None if node_arg is unknown
+              (an error listing the available nodes has been printed)
+    """
+    if node_arg == "all":
+        return list(node_mappings)
+    if node_arg in node_mappings:
+        return [node_arg]
+    print(f"Error: Unknown node '{node_arg}'")
+    print(f"Available nodes: {', '.join(node_mappings)}")
+    return None
+
+
 def parse_gitmodules():
     """
     Parse .gitmodules file to discover node mappings.
@@ -235,8 +265,7 @@ def load_local_mappings():
         dict: Mapping of node_name -> local_source_path
               Example: {"smart-resolution-calc": "C:\\code\\smart-resolution-calc-repo\\Local"}
     """
-    script_dir = Path(__file__).parent
-    local_config_path = script_dir / LOCAL_MAPPINGS_FILE
+    local_config_path = _SCRIPT_DIR / LOCAL_MAPPINGS_FILE
 
     if not local_config_path.exists():
         return {}
@@ -262,8 +291,7 @@ def get_custom_nodes_dir(root):
     Returns:
         Path: The custom_nodes directory
     """
-    script_dir = Path(__file__).parent
-    local_config_path = script_dir / LOCAL_MAPPINGS_FILE
+    local_config_path = _SCRIPT_DIR / LOCAL_MAPPINGS_FILE
 
     if local_config_path.exists():
         try:
@@ -374,36 +402,195 @@ def get_resolved_mappings(prefer_local=False, verbose=False):
     return resolved
 
 
+# Windows attribute lookup: a single GetFileAttributesExW call per path
+# instead of spawning cmd.exe to parse `dir /AL` output.
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Reparse tags that make a path a link; other reparse points (OneDrive
+# placeholders, dedup, AppExecLinks, ...) are regular files and directories
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003  # junction
+IO_REPARSE_TAG_SYMLINK = 0xA000000C
+_LINK_REPARSE_TAGS = (IO_REPARSE_TAG_MOUNT_POINT, IO_REPARSE_TAG_SYMLINK)
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    class _WIN32_FILE_ATTRIBUTE_DATA(ctypes.Structure):
+        _fields_ = [
+            ("dwFileAttributes", wintypes.DWORD),
+            ("ftCreationTime", wintypes.FILETIME),
+            ("ftLastAccessTime", wintypes.FILETIME),
+            ("ftLastWriteTime", wintypes.FILETIME),
+            ("nFileSizeHigh", wintypes.DWORD),
+            ("nFileSizeLow", wintypes.DWORD),
+        ]
+
+    _GetFileExInfoStandard = 0
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _GetFileAttributesExW = _kernel32.GetFileAttributesExW
+    _GetFileAttributesExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p]
+    _GetFileAttributesExW.restype = wintypes.BOOL
+
+
+def _win_file_attributes(path):
+    """
+    Get the Win32 file attributes of a path without following reparse points.
+
+    Args:
+        path: Path to query
+
+    Returns:
+        int: dwFileAttributes bitmask, or None if the call failed
+    """
+    data = _WIN32_FILE_ATTRIBUTE_DATA()
+    if not _GetFileAttributesExW(str(path), _GetFileExInfoStandard, ctypes.byref(data)):
+        return None
+    return data.dwFileAttributes
+
+
+def _is_link_reparse_point(path):
+    """
+    Check whether a reparse point is a symlink or junction.
+
+    Only called once FILE_ATTRIBUTE_REPARSE_POINT is known to be set, so the
+    extra lstat() is limited to actual reparse points.
+
+    Args:
+        path: Path whose attributes include FILE_ATTRIBUTE_REPARSE_POINT
+
+    Returns:
+        bool: True for symlinks and junctions
+    """
+    try:
+        return os.lstat(path).st_reparse_tag in _LINK_REPARSE_TAGS
+    except OSError:
+        return False
+
+
+# is_symlink() results for this invocation, keyed by absolute path.
+# Functions that create or remove links must call _forget_symlink().
+_symlink_cache = {}
+
+
+def _forget_symlink(path):
+    """Drop the cached is_symlink() result for a path that was just changed."""
+    _symlink_cache.pop(os.path.abspath(path), None)
+
+
 def is_symlink(path):
     """
     Check if path is a symlink or junction on Windows.
 
+    Results are cached per path for the lifetime of the process.
+
     Args:
         path: Path to check
 
     Returns:
         bool: True if path is a symlink/junction
     """
-    path = Path(path)
+    key = os.path.abspath(path)
+    cached = _symlink_cache.get(key)
+    if cached is None:
+        cached = _symlink_cache[key] = _check_symlink(Path(path))
+    return cached
+
+
+def _check_symlink(path):
+    """Uncached implementation of is_symlink()."""
     if not path.exists():
         return False
 
-    # On Windows, check for both symlinks and junctions
+    # On Windows, symlinks and junctions are both reparse points
     if sys.platform == "win32":
-        try:
-            # Use dir /AL to check for symlinks/junctions
-            result = subprocess.run(
-                ["cmd", "/c", "dir", "/AL", str(path.parent)],
-                capture_output=True,
-                text=True
-            )
-            return path.name in result.stdout
-        except Exception:
+        attrs = _win_file_attributes(path)
+        if attrs is None:
             # Fallback to pathlib check
             return path.is_symlink()
+        return bool(attrs & FILE_ATTRIBUTE_REPARSE_POINT) and _is_link_reparse_point(path)
     else:
         return path.is_symlink()
 
+def _hardlink_tree(src, dst):
+    """
+    Mirror a directory tree by hardlinking its files.
+
+    Directories are recreated and symlinks are copied as symlinks, matching
+    shutil.copytree(symlinks=True). src and dst must be on the same volume.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+
+    Raises:
+        OSError: If a directory or link could not be created
+    """
+    os.makedirs(dst)
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        target_dir = dst if rel == "." else os.path.join(dst, rel)
+        for name in list(dirnames):
+            source = os.path.join(dirpath, name)
+            if os.path.islink(source):
+                # os.walk does not descend into directory symlinks
+                os.symlink(os.readlink(source), os.path.join(target_dir, name))
+                dirnames.remove(name)
+            else:
+                os.mkdir(os.path.join(target_dir, name))
+        for name in filenames:
+            source = os.path.join(dirpath, name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), os.path.join(target_dir, name))
+            else:
+                os.link(source, os.path.join(target_dir, name))
+
+
+# exists/is_dir follow links (like Path.exists); is_link describes the path itself
+_PathInfo = namedtuple("_PathInfo", ["exists", "is_link", "is_dir"])
+_MISSING = _PathInfo(False, False, False)
+
+
+def _stat_once(path):
+    """
+    Gather exists / is_symlink / is_dir for a path in one metadata lookup.
+
+    Links need a second lookup to check that their target exists. The
+    is_symlink() cache is seeded with the result.
+
+    Args:
+        path: Path to inspect
+
+    Returns:
+        _PathInfo: exists, is_link and is_dir for the path
+    """
+    if sys.platform == "win32":
+        attrs = _win_file_attributes(path)
+        if attrs is None:
+            info = _MISSING
+        else:
+            is_link = bool(attrs & FILE_ATTRIBUTE_REPARSE_POINT) and _is_link_reparse_point(path)
+            info = _PathInfo(True, is_link, bool(attrs & FILE_ATTRIBUTE_DIRECTORY))
+    else:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            info = _MISSING
+        else:
+            info = _PathInfo(True, stat.S_ISLNK(st.st_mode), stat.S_ISDIR(st.st_mode))
+
+    if info.is_link:
+        # Dangling links don't "exist", matching Path.exists() and is_symlink()
+        try:
+            info = _PathInfo(True, True, stat.S_ISDIR(os.stat(path).st_mode))
+        except OSError:
+            info = _MISSING
+
+    _symlink_cache[os.path.abspath(path)] = info.is_link
+    return info
+
+
 def backup_node(node_path, verbose=False):
     """
     Backup a node directory to nodes_bak/ with timestamp.
@@ -439,6 +626,15 @@ def backup_node(node_path, verbose=False):
             link_target = node_path.resolve()
             with open(backup_path / "SYMLINK_INFO.txt", "w") as f:
                 f.write(f"This was a symlink to: {link_target}\n")
+        elif os.stat(node_path).st_dev == os.stat(backup_root).st_dev:
+            # Same volume: hardlink files instead of copying their bytes
+            try:
+                _hardlink_tree(node_path, backup_path)
+            except OSError as e:
+                if verbose:
+                    print(f"  Hardlink backup failed ({e}), copying instead")
+                shutil.rmtree(backup_path, ignore_errors=True)
+                shutil.copytree(node_path, backup_path, symlinks=True)
         else:
             shutil.copytree(node_path, backup_path, symlinks=True)
 
@@ -453,8 +649,8 @@ def backup_node(node_path, verbose=False):
 
 def create_symlink(target, link_path, verbose=False):
     """
-    Create a directory symlink on Windows using mklink.
-    Falls back to junction if symlink creation fails.
+    Create a directory symlink with os.symlink.
+    On Windows, falls back to a junction if symlink creation fails.
 
     Args:
         target: Target directory path
@@ -475,26 +671,36 @@ def create_symlink(target, link_path, verbose=False):
         print(f"  [X] Link path already exists: {link_path}")
         return False
 
+    _forget_symlink(link_path)
     try:
-        # Try mklink /D first (requires admin on some systems)
+        # Try a directory symlink first (needs admin or Developer Mode on Windows)
         if verbose:
             print(f"  Creating symlink: {link_path} -> {target}")
 
-        result = subprocess.run(
-            ["cmd", "/c", "mklink", "/D", str(link_path), str(target)],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
+        try:
+            os.symlink(str(target), str(link_path), target_is_directory=True)
             if verbose:
                 print(f"  [OK] Symlink created successfully")
             return True
+        except OSError as e:
+            if sys.platform != "win32":
+                print(f"  [X] Failed to create link: {e}")
+                return False
 
         # Fallback to junction (no admin required)
         if verbose:
             print(f"  Symlink failed, trying junction...")
 
+        try:
+            import _winapi
+            _winapi.CreateJunction(str(target), str(link_path))
+            if verbose:
+                print(f"  [OK] Junction created successfully")
+            return True
+        except (ImportError, AttributeError, OSError):
+            pass
+
+        # Last resort: let cmd.exe create the junction
         result = subprocess.run(
             ["cmd", "/c", "mklink", "/J", str(link_path), str(target)],
             capture_output=True,
@@ -532,16 +738,23 @@ def remove_path(path, verbose=False):
         if verbose:
             print(f"  Removing: {path}")
 
-        if is_symlink(path):
+        link = is_symlink(path)
+        _forget_symlink(path)
+        if link:
             # For symlinks/junctions, just remove the link
             if sys.platform == "win32":
-                subprocess.run(["cmd", "/c", "rmdir", str(path)], check=True)
+                # Directory links and junctions are removed with rmdir (not
+                # del); os.rmdir removes the link, never the target's contents
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    # File symlink
+                    os.unlink(path)
             else:
                 path.unlink()
         elif path.is_dir():
             def _on_rm_error(func, fpath, exc_info):
                 """Handle read-only files (e.g., .git/objects/pack on Windows)."""
-                import stat
                 os.chmod(fpath, stat.S_IWRITE)
                 func(fpath)
             shutil.rmtree(path, onerror=_on_rm_error)
@@ -561,10 +774,39 @@ def remove_path(path, verbose=False):
 # Git Operations
 # ============================================================================
 
+def _porcelain_v2_to_short(line):
+    """
+    Convert one `git status --porcelain=v2` entry line to `--short` format.
+
+    Args:
+        line: Entry line (not a "# ..." header)
+
+    Returns:
+        str: Equivalent `git status --short` line
+    """
+    kind = line[0]
+    if kind in "?!":
+        return f"{kind}{kind} {line[2:]}"
+
+    fields = line.split(" ")
+    xy = fields[1].replace(".", " ")
+    if kind == "1":
+        path = " ".join(fields[8:])
+    elif kind == "2":
+        path, orig_path = " ".join(fields[9:]).split("\t", 1)
+        path = f"{orig_path} -> {path}"
+    else:  # "u": unmerged
+        path = " ".join(fields[10:])
+    return f"{xy} {path}"
+
+
 def get_git_status(repo_path, verbose=False):
     """
     Get git status for a repository.
 
+    Branch, HEAD and working tree state come from a single
+    `git status --branch --porcelain=v2` call.
+
     Args:
         repo_path: Path to git repository
         verbose: Enable verbose output
@@ -577,32 +819,38 @@ def get_git_status(repo_path, verbose=False):
         return {"error": "Not a git repository"}
 
     try:
-        # Get current branch
-        result = subprocess.run(
-            ["git", "-C", str(repo_path), "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        branch = result.stdout.strip()
-
-        # Get status
         result = subprocess.run(
-            ["git", "-C", str(repo_path), "status", "--short"],
+            ["git", "-C", str(repo_path), "-c", "core.quotepath=false",
+             "status", "--branch", "--porcelain=v2"],
             capture_output=True,
             text=True,
             check=True
         )
-        status = result.stdout.strip()
 
-        # Get latest commit
-        result = subprocess.run(
-            ["git", "-C", str(repo_path), "log", "-1", "--oneline"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit = result.stdout.strip()
+        branch = ""
+        oid = ""
+        entries = []
+        for line in result.stdout.splitlines():
+            if line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+                branch = "" if head == "(detached)" else head
+            elif line.startswith("# branch.oid "):
+                head_oid = line[len("# branch.oid "):]
+                oid = "" if head_oid == "(initial)" else head_oid
+            elif line and not line.startswith("#"):
+                entries.append(_porcelain_v2_to_short(line))
+        status = "\n".join(entries)
+
+        # Latest commit, in `git log --oneline` form
+        commit = ""
+        if oid:
+            result = subprocess.run(
+                ["git", "-C", str(repo_path), "log", "-1", "--format=%h %s", oid],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            commit = result.stdout.strip()
 
         return {
             "branch": branch,
@@ -616,6 +864,33 @@ def get_git_status(repo_path, verbose=False):
             print(f"  Git status error: {e}")
         return {"error": str(e)}
 
+def _is_dirty(repo_path):
+    """
+    Check a repository for uncommitted changes to tracked files.
+
+    Uses `git diff HEAD --quiet`, which exits 1 at the first difference
+    instead of walking the whole tree like `git status`. Untracked files
+    are not considered.
+
+    Args:
+        repo_path: Path to git repository
+
+    Returns:
+        bool: True if staged or unstaged changes exist; False if clean,
+              not a repository, or git failed
+    """
+    repo_path = Path(repo_path)
+    if not (repo_path / ".git").exists():
+        return False
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path), "diff", "HEAD", "--quiet", "--ignore-submodules=all"],
+            capture_output=True
+        )
+    except OSError:
+        return False
+    return result.returncode == 1
+
 # ============================================================================
 # Status Command
 # ============================================================================
@@ -640,69 +915,95 @@ def cmd_status(args, config):
     print(f"{'='*70}\n")
     print(f"Root: {root}\n")
 
-    # Check each node
+    # Inspect every node up front so git queries can run in parallel
+    nodes = []
+    git_jobs = {}
     for node_name, source_path in node_mappings.items():
         node_path = nodes_dir / node_name
         source_path = Path(source_path)
 
-        print(f"[*] {node_name}")
-        print(f"   {'-'*65}")
-
         # Check existence
-        exists = node_path.exists()
-        is_link = is_symlink(node_path) if exists else False
+        exists, is_link, _ = _stat_once(node_path)
 
         # Check for disabled marker
         is_disabled = (node_path / "DISABLED").exists() if exists else False
+        source_exists = source_path.exists()
+
+        nodes.append((node_name, node_path, source_path, exists, is_link, is_disabled, source_exists))
+
+        if mode == "complete":
+            if exists and not is_disabled:
+                git_jobs[(node_name, "node")] = source_path if is_link else node_path
+            if source_exists and not is_link:
+                git_jobs[(node_name, "source")] = source_path
+
+    # Source repos are only checked for uncommitted changes
+    def _job_status(key):
+        if key[1] == "source":
+            return _is_dirty(git_jobs[key])
+        return get_git_status(git_jobs[key], args.verbose)
+
+    git_results = {}
+    if git_jobs:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(git_jobs))) as executor:
+            git_results = dict(zip(git_jobs, executor.map(_job_status, git_jobs)))
+
+    # Check each node
+    # Each node's report is written in one go rather than one print() per line
+    for node_name, node_path, source_path, exists, is_link, is_disabled, source_exists in nodes:
+        lines = []
+        out = lines.append
+        out(f"[*] {node_name}")
+        out(f"   {'-'*65}")
 
         if not exists:
-            print(f"   Status: [X] MISSING")
-            print(f"   Expected: {node_path}")
+            out(f"   Status: [X] MISSING")
+            out(f"   Expected: {node_path}")
         elif is_disabled:
-            print(f"   Status: [-] DISABLED (loading skipped)")
-            print(f"   Path: {node_path}")
+            out(f"   Status: [-] DISABLED (loading skipped)")
+            out(f"   Path: {node_path}")
         elif is_link:
-            print(f"   Status: [L] DEV MODE (symlink)")
-            print(f"   Target: {node_path.resolve()}")
+            out(f"   Status: [L] DEV MODE (symlink)")
+            out(f"   Target: {node_path.resolve()}")
 
             if mode == "complete":
-                git_info = get_git_status(source_path, args.verbose)
+                git_info = git_results[(node_name, "node")]
                 if "error" not in git_info:
-                    print(f"   Branch: {git_info['branch']}")
-                    print(f"   Commit: {git_info['commit']}")
+                    out(f"   Branch: {git_info['branch']}")
+                    out(f"   Commit: {git_info['commit']}")
                     if git_info['has_changes']:
-                        print(f"   Changes: [!] UNCOMMITTED CHANGES")
+                        out(f"   Changes: [!] UNCOMMITTED CHANGES")
                         if args.verbose:
-                            print(f"\n   Git Status:")
+                            out(f"\n   Git Status:")
                             for line in git_info['status'].split('\n'):
-                                print(f"      {line}")
+                                out(f"      {line}")
                     else:
-                        print(f"   Changes: [OK] Clean")
+                        out(f"   Changes: [OK] Clean")
         else:
-            print(f"   Status: [D] PUBLISH MODE (submodule)")
-            print(f"   Path: {node_path}")
+            out(f"   Status: [D] PUBLISH MODE (submodule)")
+            out(f"   Path: {node_path}")
 
             if mode == "complete":
-                git_info = get_git_status(node_path, args.verbose)
+                git_info = git_results[(node_name, "node")]
                 if "error" not in git_info:
-                    print(f"   Branch: {git_info['branch']}")
-                    print(f"   Commit: {git_info['commit']}")
+                    out(f"   Branch: {git_info['branch']}")
+                    out(f"   Commit: {git_info['commit']}")
                     if git_info['has_changes']:
-                        print(f"   Changes: [!] UNCOMMITTED CHANGES")
+                        out(f"   Changes: [!] UNCOMMITTED CHANGES")
                     else:
-                        print(f"   Changes: [OK] Clean")
+                        out(f"   Changes: [OK] Clean")
 
         # Check source repository
-        if source_path.exists():
-            print(f"   Source: [OK] {source_path}")
-            if mode == "complete" and not is_link:
-                source_git = get_git_status(source_path, args.verbose)
-                if "error" not in source_git and source_git['has_changes']:
-                    print(f"   Source has uncommitted changes!")
+        if source_exists:
+            out(f"   Source: [OK] {source_path}")
+            if git_results.get((node_name, "source")):
+                out(f"   Source has uncommitted changes!")
         else:
-            print(f"   Source: [X] NOT FOUND")
+            out(f"   Source: [X] NOT FOUND")
 
-        print()
+        out("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print(f"{'='*70}\n")
 
@@ -729,13 +1030,8 @@ def cmd_dev(args, config):
         return 1
 
     # Determine which nodes to process
-    if args.node == "all":
-        nodes_to_process = list(node_mappings.keys())
-    elif args.node in node_mappings:
-        nodes_to_process = [args.node]
-    else:
-        print(f"Error: Unknown node '{args.node}'")
-        print(f"Available nodes: {', '.join(node_mappings.keys())}")
+    nodes_to_process = _select_nodes(args.node, node_mappings)
+    if nodes_to_process is None:
         return 1
 
     print(f"\n{'='*70}")
@@ -751,9 +1047,10 @@ def cmd_dev(args, config):
         source_path = Path(node_mappings[node_name])
 
         print(f"Processing: {node_name}")
+        info = _stat_once(node_path)
 
         # Check if already in dev mode
-        if node_path.exists() and is_symlink(node_path):
+        if info.exists and info.is_link:
             print(f"  [i]Already in dev mode (symlink exists)")
             success_count += 1
             continue
@@ -764,7 +1061,7 @@ def cmd_dev(args, config):
             continue
 
         # Backup if requested and path exists
-        if node_path.exists() and not args.no_backup and config["backup_enabled"]:
+        if info.exists and not args.no_backup and config["backup_enabled"]:
             if not args.dry_run:
                 backup_path = backup_node(node_path, args.verbose)
                 if not backup_path:
@@ -774,7 +1071,7 @@ def cmd_dev(args, config):
                 print(f"  Would backup to: nodes_bak/{node_name}_[timestamp]")
 
         # Remove existing path
-        if node_path.exists():
+        if info.exists:
             if not args.dry_run:
                 if not remove_path(node_path, args.verbose):
                     print(f"  [X] Failed to remove existing path")
@@ -818,13 +1115,8 @@ def cmd_publish(args, config):
         return 1
 
     # Determine which nodes to process
-    if args.node == "all":
-        nodes_to_process = list(node_mappings.keys())
-    elif args.node in node_mappings:
-        nodes_to_process = [args.node]
-    else:
-        print(f"Error: Unknown node '{args.node}'")
-        print(f"Available nodes: {', '.join(node_mappings.keys())}")
+    nodes_to_process = _select_nodes(args.node, node_mappings)
+    if nodes_to_process is None:
         return 1
 
     print(f"\n{'='*70}")
@@ -839,15 +1131,16 @@ def cmd_publish(args, config):
         node_path = nodes_dir / node_name
 
         print(f"Processing: {node_name}")
+        info = _stat_once(node_path)
 
         # Check if already in publish mode (not a symlink)
-        if node_path.exists() and not is_symlink(node_path):
+        if info.exists and not info.is_link:
             print(f"  [i]Already in publish mode (submodule)")
             success_count += 1
             continue
 
         # Backup if symlink exists
-        if node_path.exists() and not args.no_backup and config["backup_enabled"]:
+        if info.exists and not args.no_backup and config["backup_enabled"]:
             if not args.dry_run:
                 backup_path = backup_node(node_path, args.verbose)
                 if not backup_path:
@@ -857,7 +1150,7 @@ def cmd_publish(args, config):
                 print(f"  Would backup symlink info to: nodes_bak/{node_name}_[timestamp]")
 
         # Remove symlink
-        if node_path.exists():
+        if info.exists:
             if not args.dry_run:
                 if not remove_path(node_path, args.verbose):
                     print(f"  [X] Failed to remove symlink")
@@ -928,13 +1221,8 @@ def cmd_disable(args, config):
         print("Error: No nodes found in .gitmodules")
         return 1
 
-    if args.node == "all":
-        nodes_to_process = list(node_mappings.keys())
-    elif args.node in node_mappings:
-        nodes_to_process = [args.node]
-    else:
-        print(f"Error: Unknown node '{args.node}'")
-        print(f"Available nodes: {', '.join(node_mappings.keys())}")
+    nodes_to_process = _select_nodes(args.node, node_mappings)
+    if nodes_to_process is None:
         return 1
 
     print(f"\n{'='*70}")
@@ -1085,13 +1373,8 @@ def cmd_enable(args, config):
         print("Error: No nodes found in .gitmodules")
         return 1
 
-    if args.node == "all":
-        nodes_to_process = list(node_mappings.keys())
-    elif args.node in node_mappings:
-        nodes_to_process = [args.node]
-    else:
-        print(f"Error: Unknown node '{args.node}'")
-        print(f"Available nodes: {', '.join(node_mappings.keys())}")
+    nodes_to_process = _select_nodes(args.node, node_mappings)
+    if nodes_to_process is None:
         return 1
 
     print(f"\n{'='*70}")
@@ -1249,44 +1532,23 @@ Examples:
         config["backup_enabled"] = False
 
     # Execute command
+    node_commands = {
+        "dev": cmd_dev,
+        "publish": cmd_publish,
+        "disable": cmd_disable,
+        "enable": cmd_enable,
+    }
     if args.command == "status":
         return cmd_status(args, config)
-    elif args.command == "dev":
-        if not args.node:
-            node_mappings = parse_gitmodules()
-            print("Error: Node name required")
-            print(f"Usage: python dev_mode.py dev [node|all]")
-            if node_mappings:
-                print(f"Available nodes: {', '.join(node_mappings.keys())}")
-            return 1
-        return cmd_dev(args, config)
-    elif args.command == "publish":
-        if not args.node:
-            node_mappings = parse_gitmodules()
-            print("Error: Node name required")
-            print(f"Usage: python dev_mode.py publish [node|all]")
-            if node_mappings:
-                print(f"Available nodes: {', '.join(node_mappings.keys())}")
-            return 1
-        return cmd_publish(args, config)
-    elif args.command == "disable":
-        if not args.node:
-            node_mappings = parse_gitmodules()
-            print("Error: Node name required")
-            print(f"Usage: python dev_mode.py disable [node|all]")
-            if node_mappings:
-                print(f"Available nodes: {', '.join(node_mappings.keys())}")
-            return 1
-        return cmd_disable(args, config)
-    elif args.command == "enable":
+    elif args.command in node_commands:
         if not args.node:
             node_mappings = parse_gitmodules()
             print("Error: Node name required")
-            print(f"Usage: python dev_mode.py enable [node|all]")
+            print(f"Usage: python dev_mode.py {args.command} [node|all]")
             if node_mappings:
-                print(f"Available nodes: {', '.join(node_mappings.keys())}")
+                print(f"Available nodes: {', '.join(node_mappings)}")
             return 1
-        return cmd_enable(args, config)
+        return node_commands[args.command](args, config)
     else:
         parser.print_help()
         return 0
@@ -11,25 +11,41 @@ Target:
 - web/*/ (generated, gitignored)
 
 Caching:
-- Per-node content hashes stored in web/.sync_hashes.json
+- Per-node fingerprints stored in web/.sync_hashes.json, built from each
+  file's size and mtime
+- A node's fingerprint is only rebuilt when its newest .js or directory
+  mtime, file count or total size changes
+- --strict-hash instead hashes every file's contents (BLAKE2b) on every run,
+  with none of the mtime/size shortcuts, so it also catches edits that keep
+  a file's size and mtime
+- Per-file hashes let a changed node copy only the files that differ;
+  files removed from a source are removed from its web/ target
+- Files are hardlinked into web/ when possible, copied otherwise
 - Symlinked nodes (dev mode) always sync — dev files change frequently
-- Submodule nodes only sync when content hash changes
+- Submodule nodes only sync when their fingerprint changes
 - --force bypasses all cache checks
 
 Usage:
-    python sync_web_files.py              # Auto-detect, per-node caching
-    python sync_web_files.py --force      # Skip all cache checks
-    python sync_web_files.py --quiet      # Suppress output
-    python sync_web_files.py --verbose    # Extra debug info
+    python sync_web_files.py                # Auto-detect, per-node caching
+    python sync_web_files.py --force        # Skip all cache checks
+    python sync_web_files.py --quiet        # Suppress output
+    python sync_web_files.py --verbose      # Extra debug info
+    python sync_web_files.py --no-hardlink  # Always copy file contents
+    python sync_web_files.py --strict-hash  # Compare file contents, not mtimes
 """
 
+import errno
+import os
 import sys
 import json
 import shutil
+import stat
 from pathlib import Path
 import argparse
 import hashlib
+import mmap
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # ============================================================================
 # Configuration
@@ -46,85 +62,359 @@ WEB_SOURCES = [
     ("nodes", "nodes"),                 # Submodules/symlinks
 ]
 
+# Directories in a source tree that are never nodes (dot-dirs are skipped too)
+_IGNORE_DIRS = frozenset({"__pycache__", "nodes_bak", "node_modules"})
+
+# File suffixes synced into web/ (a tuple so str.endswith checks them all at once)
+_WEB_EXTS = (".js",)
+
 # Cache file for per-node hashes
 _HASH_FILE = ".sync_hashes.json"
 
 # Legacy single-hash file (cleaned up on first run)
 _LEGACY_HASH_FILE = ".sync_hash"
 
+# Content fingerprint algorithm. Not security-sensitive; BLAKE2b is faster
+# than MD5 and ships with hashlib. Stored under "_algo" in the cache so an
+# algorithm change invalidates old entries instead of comparing mismatched
+# digests.
+_HASH_ALGO = "blake2b-128"
+_ALGO_KEY = "_algo"
+
+# Default fingerprint: each file contributes its size and mtime instead of
+# its content, so change detection never opens a file (rsync's quick check).
+# --strict-hash switches to _HASH_ALGO content digests. The two modes use
+# different "_algo" tags because their per-file digests aren't comparable.
+_META_ALGO = "meta+blake2b-128"
+
+# Threads shared by one sync run for hashing and copying (I/O-bound, and
+# hashlib releases the GIL, so this can exceed the core count)
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Read size when streaming a file into the hasher
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# Files larger than this are hashed through mmap instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# Buffer for copies that can't use a kernel copy path. Passed explicitly
+# rather than set on shutil.COPY_BUFSIZE, which would leak into ComfyUI.
+_COPY_BUF = 1 << 20
+
+# os.link() failures that mean "hardlinks aren't possible here, copy instead":
+# different volume, filesystem without hardlinks (FAT, some network shares),
+# no permission, or the source's link count is at its limit
+_LINK_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.EPERM, errno.EACCES, errno.EINVAL, errno.EMLINK,
+    errno.ENOTSUP, errno.EOPNOTSUPP,
+})
+
+# hashlib.file_digest was added in Python 3.11
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
 # ============================================================================
 # Per-Node Hashing
 # ============================================================================
 
-def compute_node_hash(web_source_dir):
-    """Compute content hash for a single node's web/ directory.
+def _new_hasher(data=b""):
+    """Create a hasher for _HASH_ALGO, optionally seeded with data."""
+    return hashlib.blake2b(data, digest_size=16)
 
-    Hashes every .js file's relative path and content. The relative path
-    ensures the hash changes if files are renamed or reorganized, while
-    keeping it stable across different machines (no absolute paths).
 
-    Args:
-        web_source_dir: Path to the node's web/ source directory
+def _walk_js(root, recursive=True, strict_root=False, include_dirs=False):
+    """Yield (DirEntry, rel_path) for every .js file (_WEB_EXTS) under root.
 
-    Returns:
-        str: MD5 hex digest of all .js files in the directory
+    Uses os.scandir so file/dir checks come from the directory listing
+    instead of a stat per entry. Directory symlinks are not descended into,
+    matching rglob's handling of "**". Walks with an explicit stack (no
+    recursion) and skips directories that cannot be read. Entries are
+    yielded in directory order; callers sort once if they need to.
+
+    rel_path is built from a running prefix and always uses "/", so cache
+    keys are the same on every platform.
+
+    Args:
+        root: Directory to scan (str or Path)
+        recursive: Descend into subdirectories
+        strict_root: Raise OSError if root itself can't be listed (e.g. it
+            doesn't exist) instead of yielding nothing
+        include_dirs: Also yield every subdirectory descended into; its
+            rel_path ends with "/" (see _split_walk)
+
+    Yields:
+        tuple: (os.DirEntry, str) for each .js file (and directory)
+    """
+    stack_root = os.fspath(root)
+    stack = [(stack_root, "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            if strict_root and path is stack_root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        rel_dir = prefix + entry.name + "/"
+                        stack.append((entry.path, rel_dir))
+                        if include_dirs:
+                            yield entry, rel_dir
+                elif entry.name.endswith(_WEB_EXTS) and entry.is_file():
+                    yield entry, prefix + entry.name
+
+
+def _split_walk(entries):
+    """Split a _walk_js(include_dirs=True) result into (file_entries, dir_entries)."""
+    files, dirs = [], []
+    for item in entries:
+        (dirs if item[1].endswith("/") else files).append(item)
+    return files, dirs
+
+
+def _file_digest(path):
+    """Return the hex digest of a single file's content.
+
+    Small files are read in one call. Files over _MMAP_THRESHOLD are mapped
+    and hashed straight from the page cache (no copy into a bytes object).
+    If mapping fails, hashlib.file_digest (Python 3.11+) or a chunked read
+    is used instead. Unreadable files contribute no content.
     """
-    hasher = hashlib.md5()
-    for js_file in sorted(web_source_dir.rglob("**/*.js")):
-        if js_file.is_file():
-            rel = js_file.relative_to(web_source_dir)
-            hasher.update(str(rel).encode())
+    try:
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= _MMAP_THRESHOLD:
+                return _new_hasher(f.read()).hexdigest()
             try:
-                hasher.update(js_file.read_bytes())
-            except Exception:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _new_hasher(mm).hexdigest()
+            except (OSError, ValueError):
                 pass
-    return hasher.hexdigest()
+            if _HAS_FILE_DIGEST:
+                return hashlib.file_digest(f, _new_hasher).hexdigest()
+            hasher = _new_hasher()
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+    except Exception:
+        return _new_hasher().hexdigest()
 
 
-def compute_core_hash(core_dir):
-    """Compute content hash for web_src/core/ (flat .js files, no web/ subdir).
+def _meta_digest(mtime_ns, size):
+    """Return the per-file fingerprint used when file contents aren't hashed."""
+    return f"{size}:{mtime_ns}"
+
+
+def compute_file_hashes(source_dir, entries=None, recursive=True, executor=None,
+                        metadata_only=False):
+    """Hash every .js file under a source directory individually.
+
+    Each file is recorded as [mtime_ns, size, digest]. The digest is the
+    file's content hash, or with metadata_only is built from the size and
+    mtime alone so that no file is read.
 
     Args:
-        core_dir: Path to web_src/core/
+        source_dir: Directory to hash
+        entries: (DirEntry, rel_path) list from _walk_js(source_dir), if already scanned
+        recursive: Include subdirectories (False for flat web_src/core/)
+        executor: Thread pool to hash on (a temporary one is used if None)
+        metadata_only: Fingerprint files by size and mtime instead of content
 
     Returns:
-        str: MD5 hex digest of all .js files
+        dict: Mapping of relative path -> [mtime_ns, size, digest], sorted by path
     """
-    hasher = hashlib.md5()
-    for js_file in sorted(core_dir.glob("*.js")):
-        if js_file.is_file():
-            hasher.update(js_file.name.encode())
-            try:
-                hasher.update(js_file.read_bytes())
-            except Exception:
-                pass
-    return hasher.hexdigest()
+    if entries is None:
+        entries = _walk_js(source_dir, recursive=recursive)
+
+    records = {}
+    pending = []
+    for entry, rel_path in sorted(entries, key=lambda item: item[1]):
+        try:
+            st = entry.stat()
+            mtime_ns, size = st.st_mtime_ns, st.st_size
+        except OSError:
+            mtime_ns = size = -1
+        if metadata_only:
+            records[rel_path] = [mtime_ns, size, _meta_digest(mtime_ns, size)]
+            continue
+        records[rel_path] = [mtime_ns, size, None]
+        pending.append((entry.path, rel_path))
+
+    # Overlap the per-file open/read round-trips
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            digests = list(executor.map(_file_digest, [path for path, _ in pending]))
+    else:
+        digests = list(executor.map(_file_digest, [path for path, _ in pending]))
+
+    for (_, rel_path), digest in zip(pending, digests):
+        records[rel_path][2] = digest
+    return records
+
+
+def _record_digest(record):
+    """Return the digest from a [mtime_ns, size, digest] record (None if malformed)."""
+    if isinstance(record, list) and len(record) == 3:
+        return record[2]
+    return None
 
 
-def load_cached_hashes(web_dir):
+def _combine_file_hashes(file_hashes):
+    """Fold per-file hashes into one digest for the whole directory.
+
+    The hashed bytes are each relative path followed by its digest, in path
+    order. Each directory prefix is encoded once (sorted paths share them)
+    and everything goes to the hasher in a single update() call.
+    """
+    encoded_dirs = {}
+    parts = []
+    for rel_path in sorted(file_hashes):
+        head, sep, name = rel_path.rpartition("/")
+        prefix = encoded_dirs.get(head)
+        if prefix is None:
+            prefix = encoded_dirs[head] = (head + sep).encode()
+        parts.append(prefix)
+        parts.append(name.encode())
+        parts.append(file_hashes[rel_path][2].encode())
+    return _new_hasher(b"".join(parts)).hexdigest()
+
+
+def _tree_signature(source_dir, entries, dir_entries=()):
+    """Return (mtime_max, dir_mtime_max, file_count, dir_count, total_size).
+
+    entries and dir_entries are the files and directories from
+    _walk_js(include_dirs=True). mtime_max is the newest file st_mtime_ns.
+    A rename or a delete-plus-add can leave that and the count unchanged,
+    so dir_mtime_max also tracks the newest mtime of source_dir and every
+    directory below it, whether or not it holds a .js file directly:
+    creating, renaming or removing an entry always bumps its parent's mtime.
+    total_size catches edits whose mtime was restored afterwards. All are
+    ints so they round-trip through JSON exactly.
+    """
+    mtime_max = 0
+    total_size = 0
+    for entry, _ in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        total_size += st.st_size
+        if st.st_mtime_ns > mtime_max:
+            mtime_max = st.st_mtime_ns
+
+    dir_mtime_max = 0
+    dir_paths = [os.fspath(source_dir)] + [entry.path for entry, _ in dir_entries]
+    for dir_path in dir_paths:
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            continue
+        if mtime > dir_mtime_max:
+            dir_mtime_max = mtime
+    return mtime_max, dir_mtime_max, len(entries), len(dir_entries), total_size
+
+
+def _fingerprint_source(source_dir, entries, cached_entry, executor=None, strict=False):
+    """Build a cache entry for a source directory.
+
+    By default each file is fingerprinted by size and mtime, and if the
+    tree signature (newest file and directory mtimes, file and directory
+    counts and total size) matches the cached entry, that entry is reused
+    as is. With strict, every file's contents are hashed and nothing is
+    taken from the cache.
+
+    Args:
+        source_dir: Directory that was scanned
+        entries: _walk_js(include_dirs=True) result for source_dir
+        cached_entry: Previous cache entry for this source ({} if none)
+        executor: Thread pool to hash on
+        strict: Hash file contents, bypassing every mtime/size shortcut
+
+    Returns:
+        dict: {"hash": str, "mtime_max": int, "dir_mtime_max": int,
+               "file_count": int, "dir_count": int, "total_size": int,
+               "files": {rel_path: [mtime_ns, size, digest]}}
+    """
+    entries, dir_entries = _split_walk(entries)
+    mtime_max, dir_mtime_max, file_count, dir_count, total_size = _tree_signature(
+        source_dir, entries, dir_entries)
+    if (not strict
+            and cached_entry.get("mtime_max") == mtime_max
+            and cached_entry.get("dir_mtime_max") == dir_mtime_max
+            and cached_entry.get("file_count") == file_count
+            and cached_entry.get("dir_count") == dir_count
+            and cached_entry.get("total_size") == total_size
+            and "hash" in cached_entry and "files" in cached_entry):
+        return dict(cached_entry)
+
+    file_hashes = compute_file_hashes(source_dir, entries, executor=executor,
+                                      metadata_only=not strict)
+    return {
+        "hash": _combine_file_hashes(file_hashes),
+        "mtime_max": mtime_max,
+        "dir_mtime_max": dir_mtime_max,
+        "file_count": file_count,
+        "dir_count": dir_count,
+        "total_size": total_size,
+        "files": file_hashes,
+    }
+
+
+def _cache_entry(cached_hashes, name):
+    """Return the cached entry for a node, or {} if missing or in an old format."""
+    entry = cached_hashes.get(name)
+    return entry if isinstance(entry, dict) else {}
+
+
+def _record_entry(hashes, name, entry):
+    """Store a node's cache entry, leaving it out if there is nothing to record."""
+    if entry:
+        hashes[name] = entry
+
+
+def load_cached_hashes(web_dir, algo=_HASH_ALGO):
     """Load per-node hash cache from .sync_hashes.json.
 
+    A cache written with a different hash algorithm is discarded.
+
+    Args:
+        web_dir: Path to web/ directory
+        algo: Fingerprint algorithm the caller will compare against
+
     Returns:
-        dict: Mapping of node_name -> hash string
+        dict: Mapping of node_name -> {"hash", "mtime_max", "file_count", "files"}
     """
     hash_file = web_dir / _HASH_FILE
     if not hash_file.exists():
         return {}
     try:
-        return json.loads(hash_file.read_text())
+        hashes = json.loads(hash_file.read_text())
     except Exception:
         return {}
+    if not isinstance(hashes, dict) or hashes.get(_ALGO_KEY) != algo:
+        return {}
+    return hashes
 
 
 def save_cached_hashes(web_dir, hashes):
     """Save per-node hash cache to .sync_hashes.json.
 
+    Written to a temp file and swapped in with os.replace, so an interrupted
+    save leaves the previous cache intact instead of a truncated file.
+
     Args:
         web_dir: Path to web/ directory
-        hashes: dict mapping node_name -> hash string
+        hashes: dict mapping node_name -> {"hash", "mtime_max", "file_count", "files"}
     """
     hash_file = web_dir / _HASH_FILE
-    hash_file.write_text(json.dumps(hashes, indent=2) + "\n")
+    tmp_file = hash_file.with_suffix(".json.tmp")
+    with open(tmp_file, "w") as f:
+        f.write(json.dumps(hashes, indent=2) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, hash_file)
 
 
 def cleanup_legacy_hash(web_dir):
@@ -140,38 +430,217 @@ def cleanup_legacy_hash(web_dir):
 # Sync Logic
 # ============================================================================
 
-def sync_node_files(web_source, target_dir, verbose=False):
-    """Copy all .js files from a node's web/ source to its target directory.
+if sys.platform == "win32" and sys.version_info < (3, 12):
+    import ctypes
+    from ctypes import wintypes
+
+    _CopyFileW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    _CopyFileW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL]
+    _CopyFileW.restype = wintypes.BOOL
+
+    def _fast_copy(src, dst, mtime_ns=None):
+        """Copy a file (content + mtime) with a single CopyFileW call."""
+        if not _CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError(ctypes.get_last_error())
+elif sys.platform == "win32":
+    def _fast_copy(src, dst, mtime_ns=None):
+        """Copy a file (content + mtime); copy2 uses CopyFile2 on Python 3.12+."""
+        shutil.copy2(src, dst)
+else:
+    # shutil.copyfile only has a kernel copy path on Linux (sendfile) and
+    # macOS (fcopyfile); elsewhere it loops over 64 KiB reads
+    _KERNEL_COPY = sys.platform == "darwin" or (
+        sys.platform.startswith("linux") and hasattr(os, "sendfile"))
+
+    def _fast_copy(src, dst, mtime_ns=None):
+        """Copy a file's content and modification time.
+
+        shutil.copyfile uses the kernel copy path (sendfile on Linux,
+        fcopyfile on macOS); other platforms stream through a _COPY_BUF
+        buffer. Only the mtime is carried over: copy2's copystat (mode bits,
+        flags, xattrs) is irrelevant for served web assets, and the mtime is
+        all the sync's quick checks read.
+
+        Args:
+            src: Source file
+            dst: Destination file (overwritten)
+            mtime_ns: Source st_mtime_ns if already known (saves a stat)
+        """
+        if _KERNEL_COPY:
+            shutil.copyfile(src, dst)
+        else:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, _COPY_BUF)
+        if mtime_ns is None:
+            mtime_ns = os.stat(src).st_mtime_ns
+        os.utime(dst, ns=(mtime_ns, mtime_ns))
+
+
+def _remove_stale_files(target_dir, keep, log=None):
+    """Delete files under target_dir whose relative path is not in keep.
+
+    keep holds "/"-separated relative paths, as produced by _walk_js().
+
+    Directories left empty afterwards are removed too (target_dir itself is kept).
+
+    Args:
+        target_dir: Directory to clean
+        keep: Relative paths to leave in place
+        log: List to append per-file messages to (None to stay silent)
+
+    Returns:
+        int: Number of files removed
+    """
+    removed = 0
+    target_str = os.fspath(target_dir)
+    prefix_len = len(os.path.join(target_str, ""))
+    for dirpath, dirnames, filenames in os.walk(target_str, topdown=False):
+        # os.walk() joins from target_str, so slicing off its prefix is relpath()
+        rel_dir = dirpath[prefix_len:].replace(os.sep, "/")
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            rel_path = rel_dir + "/" + name if rel_dir else name
+            if rel_path in keep:
+                continue
+            try:
+                os.remove(file_path)
+                removed += 1
+                if log is not None:
+                    log.append(f"    [DEL] {rel_path}")
+            except OSError as e:
+                if log is not None:
+                    log.append(f"    [X] Failed to remove: {rel_path} ({e})")
+        if dirpath != target_str:
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass  # Not empty
+    return removed
+
+
+def _link_or_copy(src, dst, mtime_ns=None, hardlink=True):
+    """Place src at dst as a hardlink, or as a copy if linking isn't possible.
+
+    ComfyUI serves a hardlink like any regular file, and creating one moves
+    no data. The target then shares the source's inode, so in-place edits to
+    the source show up in web/ immediately; editors and git that replace the
+    file instead leave the old inode behind, and the next sync relinks it.
+    Any existing dst is unlinked first so a copy never writes through a
+    previous link into the source file.
+
+    Args:
+        src: Source file
+        dst: Destination file (replaced)
+        mtime_ns: Source st_mtime_ns if already known (saves a stat on copy)
+        hardlink: Try os.link() before copying
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise
+    _fast_copy(src, dst, mtime_ns)
+
+
+def _copy_job(job):
+    """Run one (src, dst, mtime_ns, hardlink) job; return the exception instead of raising."""
+    try:
+        _link_or_copy(*job)
+    except Exception as e:
+        return e
+    return None
+
+
+def sync_node_files(web_source, target_dir, verbose=False, file_hashes=None, cached_files=None,
+                    executor=None, hardlink=True, quick_check=True):
+    """Copy changed .js files from a node's web/ source to its target directory.
 
     Preserves directory structure for nested files (e.g., managers/, utils/).
+    A file is skipped when its hash matches the one recorded at the last sync
+    and the target copy still exists, or (with quick_check) when the target
+    already has the source's size and mtime, as rsync does; copies carry the
+    source mtime over, so this also holds without a cache. Target files with
+    no source are removed.
 
     Args:
         web_source: Source web/ directory path
         target_dir: Target directory in web/<node_name>/
         verbose: Print debug info
+        file_hashes: Current {rel_path: [mtime_ns, size, digest]} for web_source
+            (computed if None)
+        cached_files: Same mapping from the last sync (None copies everything)
+        executor: Thread pool to copy on (copies run serially if None)
+        hardlink: Hardlink files instead of copying where the filesystem allows
+        quick_check: Skip targets whose size and mtime match the source
 
     Returns:
-        int: Number of files copied
+        tuple: (files copied, files that failed to copy)
     """
-    copied = 0
-    for js_file in web_source.rglob("**/*.js"):
-        if not js_file.is_file():
-            continue
-        rel_path = js_file.relative_to(web_source)
-        target_file = target_dir / rel_path
-        target_file.parent.mkdir(parents=True, exist_ok=True)
+    if file_hashes is None:
+        file_hashes = compute_file_hashes(web_source)
+    cached_files = cached_files or {}
+
+    # Plain strings from here on: Path joins are slow in a per-file loop
+    source_prefix = os.path.join(os.fspath(web_source), "")
+    target_str = os.fspath(target_dir)
+    target_prefix = os.path.join(target_str, "")
+
+    # Verbose lines are collected and written once, not printed per file
+    log = [] if verbose else None
+
+    os.makedirs(target_str, exist_ok=True)
+    _remove_stale_files(target_str, file_hashes, log=log)
+
+    # Decide what to copy first, then run the copies (in parallel if possible)
+    to_copy = []
+    jobs = []
+    target_parents = set()
+    for rel_path, record in file_hashes.items():
+        target_file = target_prefix + rel_path
         try:
-            shutil.copy2(js_file, target_file)
+            st = os.stat(target_file)
+        except OSError:
+            st = None
+        if st is not None and stat.S_ISREG(st.st_mode):
+            if _record_digest(cached_files.get(rel_path)) == record[2]:
+                continue
+            if quick_check and record[0] >= 0 and [st.st_mtime_ns, st.st_size] == record[:2]:
+                continue
+        target_parents.add(os.path.dirname(target_file))
+        to_copy.append(rel_path)
+        jobs.append((source_prefix + rel_path, target_file,
+                     record[0] if record[0] >= 0 else None, hardlink))
+
+    # One makedirs per distinct directory, parents first
+    for parent in sorted(target_parents, key=len):
+        os.makedirs(parent, exist_ok=True)
+
+    errors = executor.map(_copy_job, jobs) if executor else map(_copy_job, jobs)
+
+    copied = failed = 0
+    for rel_path, error in zip(to_copy, errors):
+        if error is None:
             copied += 1
-            if verbose:
-                print(f"    [COPY] {rel_path}")
-        except Exception as e:
-            if verbose:
-                print(f"    [X] Failed: {rel_path} ({e})")
-    return copied
+            if log is not None:
+                log.append(f"    [COPY] {rel_path}")
+        else:
+            failed += 1
+            if log is not None:
+                log.append(f"    [X] Failed: {rel_path} ({error})")
+
+    if log:
+        sys.stdout.write("\n".join(log) + "\n")
+    return copied, failed
 
 
-def sync_web_files(mode=None, force=False, quiet=False, verbose=False):
+def sync_web_files(mode=None, force=False, quiet=False, verbose=False, hardlink=True,
+                   strict_hash=False):
     """Main sync function with per-node caching.
 
     Each node's web files are hashed independently. Only nodes with changed
@@ -183,6 +652,9 @@ def sync_web_files(mode=None, force=False, quiet=False, verbose=False):
         force: Skip all cache checks, sync everything
         quiet: Suppress output
         verbose: Extra debug output
+        hardlink: Hardlink files into web/ where possible instead of copying
+        strict_hash: Detect changes by hashing every file's contents on every
+            run, without any size/mtime shortcut
 
     Returns:
         dict with sync stats
@@ -194,115 +666,146 @@ def sync_web_files(mode=None, force=False, quiet=False, verbose=False):
     # Clean up legacy single-hash file on first run
     cleanup_legacy_hash(web_dir)
 
-    cached_hashes = load_cached_hashes(web_dir)
-    new_hashes = {}
+    algo = _HASH_ALGO if strict_hash else _META_ALGO
+    cached_hashes = load_cached_hashes(web_dir, algo)
+    new_hashes = {_ALGO_KEY: algo}
 
     # Track stats
     synced_nodes = []
     skipped_nodes = []
     total_files = 0
+    total_failed = 0
+    failed_nodes = []
 
     if not quiet:
         print("[DazzleNodes] Syncing web resources...")
 
-    # Process each source
-    for source_path_str, source_type in WEB_SOURCES:
-        source_path = _PROJECT_ROOT / source_path_str
-        if not source_path.exists():
-            if verbose:
-                print(f"  [Skip] {source_path} does not exist")
-            continue
-
-        # Special case: web_src/core (flat .js files, no web/ subdir)
-        if source_type == "core" and source_path.name == "core":
-            current_hash = compute_core_hash(source_path)
-            new_hashes["_core"] = current_hash
-
-            if not force and cached_hashes.get("_core") == current_hash:
-                skipped_nodes.append("core")
+    # Process each source; one thread pool serves every node in this run
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        for source_path_str, source_type in WEB_SOURCES:
+            source_path = _PROJECT_ROOT / source_path_str
+            if not source_path.exists():
                 if verbose:
-                    print(f"  [Core] Up-to-date (cached)")
+                    print(f"  [Skip] {source_path} does not exist")
                 continue
 
-            target_dir = web_dir / "core"
-            # Remove stale target and recreate
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            target_dir.mkdir(exist_ok=True)
+            # Special case: web_src/core (flat .js files, no web/ subdir)
+            if source_type == "core" and source_path.name == "core":
+                cached = {} if force else _cache_entry(cached_hashes, "_core")
+                entries = list(_walk_js(source_path, recursive=False))
+                current = _fingerprint_source(source_path, entries, cached, executor=executor,
+                                              strict=strict_hash)
 
-            core_files = 0
-            for js_file in source_path.glob("*.js"):
-                target_file = target_dir / js_file.name
-                try:
-                    shutil.copy2(js_file, target_file)
-                    core_files += 1
-                except Exception as e:
+                if not force and cached.get("hash") == current["hash"]:
+                    new_hashes["_core"] = current
+                    skipped_nodes.append("core")
                     if verbose:
-                        print(f"    [X] Failed: {js_file.name} ({e})")
-
-            total_files += core_files
-            synced_nodes.append("core")
-            if not quiet:
-                print(f"  [Core] Synced core library ({core_files} files)")
-            continue
-
-        # Normal case: scan for nodes with web/ directories
-        if verbose:
-            print(f"  [Scan] {source_path}")
-
-        for node_dir in sorted(source_path.iterdir()):
-            if not node_dir.is_dir():
-                continue
-
-            web_source = node_dir / "web"
-            if not web_source.exists():
-                if verbose:
-                    print(f"    [Skip] {node_dir.name} (no web/)")
+                        print(f"  [Core] Up-to-date (cached)")
+                    continue
+
+                # Same differential update as nodes: unchanged files stay put
+                core_files, failed = sync_node_files(source_path, web_dir / "core",
+                                                     verbose=verbose,
+                                                     file_hashes=current["files"],
+                                                     cached_files=cached.get("files"),
+                                                     executor=executor, hardlink=hardlink,
+                                                     quick_check=not (force or strict_hash))
+                # A failed copy keeps the old entry so the next run retries it
+                _record_entry(new_hashes, "_core", current if not failed else cached)
+                if failed:
+                    total_failed += failed
+                    failed_nodes.append("core")
+
+                total_files += core_files
+                synced_nodes.append("core")
+                if not quiet:
+                    print(f"  [Core] Synced core library ({core_files} files)")
                 continue
 
-            node_name = node_dir.name
-            is_symlink = node_dir.is_symlink()
-
-            # Compute current content hash
-            current_hash = compute_node_hash(web_source)
-            new_hashes[node_name] = current_hash
-
-            # Determine if this node needs syncing:
-            # - force: always sync everything
-            # - symlink (dev mode): always sync — dev files change frequently
-            # - hash mismatch: content changed since last sync
-            needs_update = force or is_symlink or (cached_hashes.get(node_name) != current_hash)
-
-            if not needs_update:
-                skipped_nodes.append(node_name)
-                if verbose:
-                    print(f"    [{source_type}] {node_name} — up-to-date (cached)")
-                continue
-
-            # Determine why we're syncing (for logging)
-            if verbose or (not quiet and is_symlink):
-                reason = "dev mode" if is_symlink else ("forced" if force else "changed")
-                print(f"  [{source_type}] {node_name} — syncing ({reason})")
-
-            # Remove stale target and recreate
-            target_dir = web_dir / node_name
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            target_dir.mkdir(exist_ok=True)
-
-            node_files = sync_node_files(web_source, target_dir, verbose=verbose)
-            total_files += node_files
-            synced_nodes.append(node_name)
-
-            if not quiet and not verbose:
-                if not is_symlink:
-                    print(f"  [{source_type}] {node_name} ({node_files} files)")
-
-    # Save updated per-node hashes
+            # Normal case: scan for nodes with web/ directories
+            if verbose:
+                print(f"  [Scan] {source_path}")
+
+            with os.scandir(source_path) as it:
+                node_entries = sorted(
+                    (entry for entry in it
+                     if not entry.name.startswith(".") and entry.name not in _IGNORE_DIRS),
+                    key=lambda entry: entry.name,
+                )
+
+            for node_entry in node_entries:
+                # Follows symlinks: dev-mode nodes are links to directories
+                if not node_entry.is_dir():
+                    continue
+
+                # Dev mode links nodes as symlinks, or junctions on Windows.
+                # Both checks read the type cached by scandir, with no stat.
+                is_junction = getattr(node_entry, "is_junction", None)  # Python 3.12+
+                is_symlink = node_entry.is_symlink() or (is_junction is not None
+                                                         and is_junction())
+
+                node_name = node_entry.name
+                web_source = os.path.join(node_entry.path, "web")
+
+                # Listing web/ doubles as the existence check: one open, no stat
+                try:
+                    entries = list(_walk_js(web_source, strict_root=True, include_dirs=True))
+                except OSError:
+                    if verbose:
+                        print(f"    [Skip] {node_name} (no web/)")
+                    continue
+
+                # Compute current content hash (skipped if mtimes/count unchanged)
+                cached = {} if force else _cache_entry(cached_hashes, node_name)
+                current = _fingerprint_source(web_source, entries, cached, executor=executor,
+                                              strict=strict_hash)
+
+                # Determine if this node needs syncing:
+                # - force: always sync everything
+                # - symlink (dev mode): always sync — dev files change frequently
+                # - hash mismatch: content changed since last sync
+                needs_update = force or is_symlink or (cached.get("hash") != current["hash"])
+
+                if not needs_update:
+                    new_hashes[node_name] = current
+                    skipped_nodes.append(node_name)
+                    if verbose:
+                        print(f"    [{source_type}] {node_name} — up-to-date (cached)")
+                    continue
+
+                # Determine why we're syncing (for logging)
+                if verbose or (not quiet and is_symlink):
+                    reason = "dev mode" if is_symlink else ("forced" if force else "changed")
+                    print(f"  [{source_type}] {node_name} — syncing ({reason})")
+
+                # Copy changed files in place; drop files no longer in the source
+                target_dir = web_dir / node_name
+                node_files, failed = sync_node_files(web_source, target_dir, verbose=verbose,
+                                                     file_hashes=current["files"],
+                                                     cached_files=cached.get("files"),
+                                                     executor=executor, hardlink=hardlink,
+                                                     quick_check=not (force or strict_hash))
+                _record_entry(new_hashes, node_name, current if not failed else cached)
+                if failed:
+                    total_failed += failed
+                    failed_nodes.append(node_name)
+                total_files += node_files
+                synced_nodes.append(node_name)
+
+                if not quiet and not verbose:
+                    if not is_symlink:
+                        print(f"  [{source_type}] {node_name} ({node_files} files)")
+
+    # Save updated per-node hashes last: they are the commit point of the sync
     save_cached_hashes(web_dir, new_hashes)
 
     elapsed = time.time() - start_time
 
+    # Printed even when quiet: web/ is missing files until a later sync succeeds
+    if total_failed:
+        print(f"[DazzleNodes] [WARN] {total_failed} file(s) failed to sync for: "
+              f"{', '.join(failed_nodes)} (will retry on the next sync)")
+
     if not quiet:
         if synced_nodes:
             print(f"[DazzleNodes] Synced {len(synced_nodes)} node(s), "
@@ -318,6 +821,7 @@ def sync_web_files(mode=None, force=False, quiet=False, verbose=False):
         "nodes": len(synced_nodes),
         "skipped": len(skipped_nodes),
         "files": total_files,
+        "failed": total_failed,
         "time": elapsed
     }
 
@@ -335,11 +839,17 @@ Examples:
   python sync_web_files.py --force          # Skip all caches, sync everything
   python sync_web_files.py --quiet          # Suppress output
   python sync_web_files.py --verbose        # Extra debug info
+  python sync_web_files.py --no-hardlink    # Copy instead of hardlinking
+  python sync_web_files.py --strict-hash    # Hash file contents
 
 Caching:
-  - Submodule nodes: cached by content hash, only sync when changed
+  - Submodule nodes: cached by size/mtime fingerprint (content hash with
+    --strict-hash), only sync when changed
   - Symlinked nodes (dev mode): always sync, no cache check
   - Per-node hashes stored in web/.sync_hashes.json
+
+Files are hardlinked into web/ when it is on the same filesystem as the
+sources, and copied otherwise.
         """
     )
     parser.add_argument("--force", action="store_true",
@@ -348,6 +858,10 @@ Caching:
                         help="Suppress output")
     parser.add_argument("--verbose", action="store_true",
                         help="Extra debug output")
+    parser.add_argument("--no-hardlink", action="store_true",
+                        help="Always copy files instead of hardlinking them")
+    parser.add_argument("--strict-hash", action="store_true",
+                        help="Detect changes by file content instead of size and mtime")
 
     args = parser.parse_args()
 
@@ -355,7 +869,9 @@ Caching:
         stats = sync_web_files(
             force=args.force,
             quiet=args.quiet,
-            verbose=args.verbose
+            verbose=args.verbose,
+            hardlink=not args.no_hardlink,
+            strict_hash=args.strict_hash
         )
 
         if args.verbose and not args.quiet:
@@ -364,6 +880,7 @@ Caching:
             print(f"  Synced: {stats['nodes']}")
             print(f"  Skipped: {stats['skipped']}")
             print(f"  Files: {stats['files']}")
+            print(f"  Failed: {stats['failed']}")
             print(f"  Time: {stats['time']:.3f}s")
 
     except Exception as e:
@@ -0,0 +1,264 @@
+"""
+Test helpers in scripts/dev_mode.py.
+
+Note: Git output is canned where possible; the _is_dirty() test needs a git
+executable and skips without one. Nothing outside tmp_path is touched.
+"""
+import errno
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+DEV_MODE_SCRIPT = Path(__file__).parent.parent / "scripts" / "dev_mode.py"
+
+
+@pytest.fixture
+def dev_mode():
+    """Load dev_mode.py as a fresh module (its is_symlink() cache starts empty)."""
+    spec = importlib.util.spec_from_file_location("dev_mode_under_test", DEV_MODE_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# git status --porcelain=v2 parsing
+# ============================================================================
+
+@pytest.mark.parametrize("line, expected", [
+    # Ordinary changed entries (type 1), including a path with spaces
+    ("1 .M N... 100644 100644 100644 1111111 1111111 file.txt", " M file.txt"),
+    ("1 A. N... 000000 100644 100644 0000000 2222222 added.py", "A  added.py"),
+    ("1 MD N... 100644 100644 000000 1111111 2222222 dir/with space.js",
+     "MD dir/with space.js"),
+    # Renamed or copied entries (type 2) carry the original path after a tab
+    ("2 R. N... 100644 100644 100644 1111111 1111111 R100 new name.py\told name.py",
+     "R  old name.py -> new name.py"),
+    ("2 C. N... 100644 100644 100644 1111111 1111111 C75 copy.py\torig.py",
+     "C  orig.py -> copy.py"),
+    # Unmerged entries (type u)
+    ("u UU N... 100644 100644 100644 100644 1111111 2222222 3333333 conflict.py",
+     "UU conflict.py"),
+    ("u AA N... 000000 100644 100644 100644 0000000 2222222 3333333 both added.py",
+     "AA both added.py"),
+    # Untracked and ignored entries
+    ("? untracked dir/file.txt", "?? untracked dir/file.txt"),
+    ("! build.log", "!! build.log"),
+])
+def test_porcelain_v2_to_short(dev_mode, line, expected):
+    """Each porcelain v2 entry type maps to its `git status --short` line."""
+    assert dev_mode._porcelain_v2_to_short(line) == expected
+
+
+def _fake_git(monkeypatch, dev_mode, status_output, log_output="abc1234 Latest commit"):
+    """Serve canned output for the git calls get_git_status() makes."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        stdout = status_output if "status" in cmd else log_output + "\n"
+        return SimpleNamespace(stdout=stdout, returncode=0)
+
+    monkeypatch.setattr(dev_mode.subprocess, "run", run)
+    return calls
+
+
+@pytest.mark.parametrize("headers, branch, commit", [
+    # On a branch, ahead 2 / behind 1 of its upstream
+    (["# branch.oid 0123456789abcdef0123456789abcdef01234567", "# branch.head main",
+      "# branch.upstream origin/main", "# branch.ab +2 -1"], "main", "abc1234 Latest commit"),
+    # Detached HEAD
+    (["# branch.oid 0123456789abcdef0123456789abcdef01234567", "# branch.head (detached)"],
+     "", "abc1234 Latest commit"),
+    # Fresh repository without commits: no log lookup
+    (["# branch.oid (initial)", "# branch.head main"], "main", ""),
+])
+def test_get_git_status_parses_porcelain_v2(dev_mode, tmp_path, monkeypatch,
+                                            headers, branch, commit):
+    """Headers set branch/commit; every entry line is converted, header lines never are."""
+    (tmp_path / ".git").mkdir()
+    entries = [
+        "1 .M N... 100644 100644 100644 1111111 1111111 file.txt",
+        "2 R. N... 100644 100644 100644 1111111 1111111 R100 new.py\told.py",
+        "u UU N... 100644 100644 100644 100644 1111111 2222222 3333333 conflict.py",
+        "? notes.txt",
+    ]
+    calls = _fake_git(monkeypatch, dev_mode, "\n".join(headers + entries) + "\n")
+
+    result = dev_mode.get_git_status(tmp_path)
+    assert result == {
+        "branch": branch,
+        "status": " M file.txt\nR  old.py -> new.py\nUU conflict.py\n?? notes.txt",
+        "commit": commit,
+        "has_changes": True,
+    }
+    assert len(calls) == (2 if commit else 1)
+
+
+def test_get_git_status_clean_repo(dev_mode, tmp_path, monkeypatch):
+    """A clean tree (ahead/behind headers only) has no status lines."""
+    (tmp_path / ".git").mkdir()
+    _fake_git(monkeypatch, dev_mode,
+              "# branch.oid 0123456789abcdef0123456789abcdef01234567\n"
+              "# branch.head main\n# branch.upstream origin/main\n# branch.ab +0 -0\n")
+
+    result = dev_mode.get_git_status(tmp_path)
+    assert result["status"] == ""
+    assert result["has_changes"] is False
+
+
+def test_get_git_status_not_a_repo(dev_mode, tmp_path):
+    """Directories without .git report an error instead of running git."""
+    assert dev_mode.get_git_status(tmp_path) == {"error": "Not a git repository"}
+
+
+# ============================================================================
+# _is_dirty
+# ============================================================================
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_is_dirty(dev_mode, tmp_path):
+    """Only changes to tracked files make a repository dirty."""
+    assert dev_mode._is_dirty(tmp_path) is False  # Not a repository
+
+    def git(*args):
+        subprocess.run(["git", "-C", str(tmp_path), "-c", "user.name=t",
+                        "-c", "user.email=t@example.com", *args],
+                       check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "tracked.txt").write_text("one\n")
+    git("add", "tracked.txt")
+    git("commit", "-q", "-m", "init")
+    assert dev_mode._is_dirty(tmp_path) is False
+
+    (tmp_path / "untracked.txt").write_text("new\n")
+    assert dev_mode._is_dirty(tmp_path) is False
+
+    (tmp_path / "tracked.txt").write_text("two\n")
+    assert dev_mode._is_dirty(tmp_path) is True
+
+    git("add", "tracked.txt")
+    assert dev_mode._is_dirty(tmp_path) is True
+
+
+# ============================================================================
+# _stat_once and reparse-point filtering
+# ============================================================================
+
+def test_stat_once_posix(dev_mode, tmp_path):
+    """One lstat answers exists/is_link/is_dir and seeds the is_symlink() cache."""
+    target = tmp_path / "target"
+    target.mkdir()
+    (tmp_path / "file.txt").write_text("x")
+    link = tmp_path / "link"
+    dangling = tmp_path / "dangling"
+    try:
+        link.symlink_to(target, target_is_directory=True)
+        dangling.symlink_to(tmp_path / "missing")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+
+    if sys.platform == "win32":
+        pytest.skip("POSIX code path")
+    assert dev_mode._stat_once(target) == (True, False, True)
+    assert dev_mode._stat_once(tmp_path / "file.txt") == (True, False, False)
+    assert dev_mode._stat_once(link) == (True, True, True)
+    assert dev_mode._stat_once(dangling) == (False, False, False)
+    assert dev_mode._stat_once(tmp_path / "missing") == (False, False, False)
+    assert dev_mode._symlink_cache[os.path.abspath(link)] is True
+
+
+@pytest.mark.parametrize("tag, is_link", [
+    (0xA000000C, True),   # IO_REPARSE_TAG_SYMLINK
+    (0xA0000003, True),   # IO_REPARSE_TAG_MOUNT_POINT (junction)
+    (0x9000001A, False),  # IO_REPARSE_TAG_CLOUD_6 (OneDrive placeholder)
+    (0x80000013, False),  # IO_REPARSE_TAG_DEDUP
+    (0x8000001B, False),  # IO_REPARSE_TAG_APPEXECLINK
+])
+def test_reparse_tag_filtering(dev_mode, tmp_path, monkeypatch, tag, is_link):
+    """Only symlink and junction reparse points count as links on Windows."""
+    attrs = dev_mode.FILE_ATTRIBUTE_REPARSE_POINT | dev_mode.FILE_ATTRIBUTE_DIRECTORY
+    monkeypatch.setattr(dev_mode.sys, "platform", "win32")
+    monkeypatch.setattr(dev_mode, "_win_file_attributes", lambda path: attrs, raising=False)
+    monkeypatch.setattr(dev_mode.os, "lstat", lambda path: SimpleNamespace(st_reparse_tag=tag))
+
+    assert dev_mode._is_link_reparse_point(tmp_path) is is_link
+    assert dev_mode._stat_once(tmp_path) == (True, is_link, True)
+    assert dev_mode.is_symlink(tmp_path) is is_link
+
+
+# ============================================================================
+# Hardlink backups
+# ============================================================================
+
+def test_hardlink_tree(dev_mode, tmp_path):
+    """Files are hardlinked, directories recreated and symlinks copied as links."""
+    src = tmp_path / "src"
+    (src / "sub" / "deep").mkdir(parents=True)
+    (src / "top.py").write_text("top")
+    (src / "sub" / "deep" / "leaf.js").write_text("leaf")
+    (src / "empty").mkdir()
+    try:
+        (src / "file_link").symlink_to("top.py")
+        (src / "dir_link").symlink_to("sub", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+
+    dst = tmp_path / "dst"
+    dev_mode._hardlink_tree(str(src), str(dst))
+
+    assert (dst / "top.py").samefile(src / "top.py")
+    assert (dst / "sub" / "deep" / "leaf.js").samefile(src / "sub" / "deep" / "leaf.js")
+    assert (dst / "empty").is_dir()
+    assert os.readlink(dst / "file_link") == "top.py"
+    assert os.readlink(dst / "dir_link") == "sub"
+
+
+def test_hardlink_tree_requires_new_destination(dev_mode, tmp_path):
+    """An existing destination is an error, like shutil.copytree."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "dst").mkdir()
+    with pytest.raises(FileExistsError):
+        dev_mode._hardlink_tree(str(tmp_path / "src"), str(tmp_path / "dst"))
+
+
+def _make_node(tmp_path):
+    node = tmp_path / "nodes" / "my-node"
+    (node / "web").mkdir(parents=True)
+    (node / "__init__.py").write_text("init")
+    (node / "web" / "main.js").write_text("main")
+    return node
+
+
+def test_backup_node_hardlinks_on_same_volume(dev_mode, tmp_path, monkeypatch):
+    """backup_node() snapshots a node by hardlinking into nodes_bak/."""
+    monkeypatch.setattr(dev_mode, "_DAZZLENODES_ROOT", tmp_path)
+    node = _make_node(tmp_path)
+
+    backup = dev_mode.backup_node(node)
+    assert backup.parent == tmp_path / "nodes_bak"
+    assert (backup / "web" / "main.js").samefile(node / "web" / "main.js")
+
+
+def test_backup_node_falls_back_to_copy(dev_mode, tmp_path, monkeypatch):
+    """If hardlinking fails, the partial snapshot is replaced by a full copy."""
+    monkeypatch.setattr(dev_mode, "_DAZZLENODES_ROOT", tmp_path)
+    node = _make_node(tmp_path)
+
+    def no_link(src, dst, *args, **kwargs):
+        raise OSError(errno.EPERM, "hardlinks not permitted")
+
+    monkeypatch.setattr(dev_mode.os, "link", no_link)
+    backup = dev_mode.backup_node(node)
+
+    assert (backup / "__init__.py").read_text() == "init"
+    assert (backup / "web" / "main.js").read_text() == "main"
+    assert not (backup / "web" / "main.js").samefile(node / "web" / "main.js")
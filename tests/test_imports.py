@@ -69,6 +69,54 @@ def test_init_exports():
         "__init__.py doesn't export __version__"
 
 
+def test_packs_match_gitmodules():
+    """Test every submodule in .gitmodules is registered in __init__.py's _PACKS."""
+    import ast
+    import configparser
+
+    root = Path(__file__).parent.parent
+    tree = ast.parse((root / "__init__.py").read_text(encoding='utf-8'))
+
+    packs = None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "_PACKS" for t in node.targets
+        ):
+            packs = ast.literal_eval(node.value)
+    assert packs is not None, "__init__.py doesn't define _PACKS"
+
+    pack_dirs = [dir_name for dir_name, _ in packs]
+    assert len(pack_dirs) == len(set(pack_dirs)), "_PACKS has duplicate entries"
+
+    gitmodules = configparser.ConfigParser()
+    gitmodules.read(root / ".gitmodules")
+    submodules = {
+        gitmodules[section]["path"].split("/", 1)[1]
+        for section in gitmodules.sections()
+        if gitmodules[section].get("path", "").startswith("nodes/")
+    }
+
+    assert submodules == set(pack_dirs), \
+        f"_PACKS and .gitmodules disagree: {sorted(submodules ^ set(pack_dirs))}"
+
+
+def test_init_does_not_modify_sys_path():
+    """Test __init__.py loads packs by file location, not via sys.path."""
+    import ast
+
+    root = Path(__file__).parent.parent
+    tree = ast.parse((root / "__init__.py").read_text(encoding='utf-8'))
+
+    for node in ast.walk(tree):
+        # sys.path.insert(...), sys.path.append(...), sys.path.extend(...)
+        if isinstance(node, ast.Attribute) and node.attr in ("insert", "append", "extend"):
+            target = node.value
+            assert not (
+                isinstance(target, ast.Attribute) and target.attr == "path"
+                and isinstance(target.value, ast.Name) and target.value.id == "sys"
+            ), "__init__.py must not modify sys.path (use spec_from_file_location)"
+
+
 def test_sync_script_exists():
     """Test sync_web_files.py exists and has main function."""
     root = Path(__file__).parent.parent
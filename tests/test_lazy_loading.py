@@ -0,0 +1,186 @@
+"""
+Test the lazy (PEP 562) node-pack loading in __init__.py.
+
+Note: The package is copied into a temporary directory with stub packs in
+place of the real submodules, so nothing in the checkout is touched.
+"""
+import importlib.util
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).parent.parent
+PACKAGE_NAME = "dazzlenodes_under_test"
+
+PACK_TEMPLATE = '''
+with open({log!r}, "a") as f:
+    f.write({name!r} + "\\n")
+NODE_CLASS_MAPPINGS = {{{name!r}: object}}
+NODE_DISPLAY_NAME_MAPPINGS = {{{name!r}: {name!r}}}
+'''
+
+
+def _pack_names():
+    """Read the pack directory names from _PACKS without importing __init__.py."""
+    import ast
+
+    tree = ast.parse((ROOT / "__init__.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                getattr(t, "id", None) == "_PACKS" for t in node.targets):
+            return [elt.elts[0].value for elt in node.value.elts]
+    raise AssertionError("_PACKS not found in __init__.py")
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """Copy __init__.py into tmp_path with stub packs; return (import_fn, load log)."""
+    pkg_dir = tmp_path / "DazzleNodes"
+    (pkg_dir / "scripts").mkdir(parents=True)
+    shutil.copy(ROOT / "__init__.py", pkg_dir / "__init__.py")
+    shutil.copy(ROOT / "version.py", pkg_dir / "version.py")
+    shutil.copy(ROOT / "scripts" / "sync_web_files.py", pkg_dir / "scripts" / "sync_web_files.py")
+
+    log = tmp_path / "loads.txt"
+    names = _pack_names()
+    for name in names:
+        pack_dir = pkg_dir / "nodes" / name
+        pack_dir.mkdir(parents=True)
+        (pack_dir / "__init__.py").write_text(PACK_TEMPLATE.format(log=str(log), name=name))
+
+    monkeypatch.delenv("DAZZLENODES_VERBOSE", raising=False)
+    owned = [PACKAGE_NAME, PACKAGE_NAME + ".version", "_dazzle_sync"]
+    owned += [name.replace("-", "_") for name in names]
+    saved = {name: sys.modules.pop(name) for name in owned if name in sys.modules}
+
+    def import_package():
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE_NAME, pkg_dir / "__init__.py", submodule_search_locations=[str(pkg_dir)])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE_NAME] = module
+        spec.loader.exec_module(module)
+        return module
+
+    yield import_package, log
+
+    for name in owned:
+        sys.modules.pop(name, None)
+    sys.modules.update(saved)
+
+
+def _loads(log):
+    return log.read_text().split() if log.exists() else []
+
+
+def test_import_does_not_execute_packs(package):
+    """Importing the package syncs web files but runs no pack code."""
+    import_package, log = package
+    module = import_package()
+    assert _loads(log) == []
+    assert "NODE_CLASS_MAPPINGS" not in vars(module)
+
+
+def test_first_access_loads_each_pack_once(package):
+    """The first mapping access loads every pack once; later reads reuse it."""
+    import_package, log = package
+    module = import_package()
+    names = _pack_names()
+
+    assert sorted(module.NODE_CLASS_MAPPINGS) == sorted(names)
+    assert sorted(module.NODE_DISPLAY_NAME_MAPPINGS) == sorted(names)
+    assert module.load_node_module(names[0], "first") == 1
+    assert sorted(_loads(log)) == sorted(names)
+
+
+def test_load_node_module_before_first_access(package):
+    """load_node_module() triggers the lazy load instead of raising NameError."""
+    import_package, log = package
+    module = import_package()
+    names = _pack_names()
+
+    assert module.load_node_module(names[0], "first") == 1
+    assert sorted(module.NODE_CLASS_MAPPINGS) == sorted(names)
+    assert sorted(_loads(log)) == sorted(names)
+
+
+def test_failed_load_is_retried(package):
+    """An exception while loading unbinds the mappings so the next access retries."""
+    import_package, log = package
+    module = import_package()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    finish_submodule_init = module._finish_submodule_init
+    module._finish_submodule_init = interrupted
+    with pytest.raises(KeyboardInterrupt):
+        module.NODE_CLASS_MAPPINGS
+    assert "NODE_CLASS_MAPPINGS" not in vars(module)
+
+    module._finish_submodule_init = finish_submodule_init
+    assert sorted(module.NODE_CLASS_MAPPINGS) == sorted(_pack_names())
+
+
+def test_unknown_attribute_raises(package):
+    """Module __getattr__ only handles the two mapping names."""
+    import_package, _ = package
+    module = import_package()
+    with pytest.raises(AttributeError):
+        module.NOT_A_REAL_ATTRIBUTE
+    assert "NODE_CLASS_MAPPINGS" not in vars(module)
+
+
+def test_sync_stamp_waits_for_submodule_init(package):
+    """The import-time sync leaves no stamp while submodules are being initialised."""
+    import_package, log = package
+    pkg_dir = log.parent / "DazzleNodes"
+    names = _pack_names()
+    (pkg_dir / "nodes" / names[0] / "__init__.py").unlink()
+    stamp = pkg_dir / "web" / ".sync_stamp"
+
+    module = import_package()
+    assert module._pending_submodules == {names[0]}
+    assert not stamp.exists()
+
+    # Loading settles the submodule init, and its re-sync records the stamp
+    module.NODE_CLASS_MAPPINGS
+    assert not module._pending_submodules
+    assert stamp.exists()
+
+
+def test_sync_stamp_skipped_after_failed_copies(package):
+    """A web sync that reports failed copies leaves no stamp, so the next import retries."""
+    import_package, log = package
+    module = import_package()
+    stamp = log.parent / "DazzleNodes" / "web" / ".sync_stamp"
+    assert stamp.exists()
+
+    stamp.unlink()
+    sys.modules["_dazzle_sync"].sync_web_files = lambda quiet: {"failed": 1}
+    module._sync_web_resources()
+    assert not stamp.exists()
+
+
+def test_emptied_pack_clears_submodules_marker(package):
+    """A pack emptied after the marker was written makes the next import rescan."""
+    import_package, log = package
+    pkg_dir = log.parent / "DazzleNodes"
+    names = _pack_names()
+    marker = pkg_dir / ".dazzle_submodules_ok"
+
+    import_package()
+    assert marker.exists()
+
+    # Like 'git submodule deinit': nodes/ and .gitmodules keep their mtimes
+    (pkg_dir / "nodes" / names[0] / "__init__.py").unlink()
+    module = import_package()
+    assert module._pending_submodules == frozenset()
+    assert names[0] not in module.NODE_CLASS_MAPPINGS
+    assert not marker.exists()
+
+    module = import_package()
+    assert module._pending_submodules == {names[0]}
+    module.NODE_CLASS_MAPPINGS  # Settle the background submodule update
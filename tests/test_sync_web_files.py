@@ -0,0 +1,199 @@
+"""
+Test scripts/sync_web_files.py against a temporary project tree.
+
+Note: These tests use synthetic nodes only; no submodules are required.
+"""
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+
+SYNC_SCRIPT = Path(__file__).parent.parent / "scripts" / "sync_web_files.py"
+
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    """Load sync_web_files.py with its project root pointed at tmp_path."""
+    spec = importlib.util.spec_from_file_location("sync_web_files_under_test", SYNC_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "_PROJECT_ROOT", tmp_path)
+    return module
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_sync_copies_nested_files_then_caches(sync, tmp_path):
+    """Nested .js files are copied once; an unchanged tree is skipped."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "main.js", "main")
+    _write(web_src / "utils" / "helper.js", "helper")
+    _write(web_src / "style.css", "ignored")
+
+    stats = sync.sync_web_files(quiet=True)
+    assert stats["files"] == 2
+    assert (tmp_path / "web" / "alpha" / "utils" / "helper.js").read_text() == "helper"
+    assert not (tmp_path / "web" / "alpha" / "style.css").exists()
+
+    stats = sync.sync_web_files(quiet=True)
+    assert stats["cached"]
+
+
+def test_sync_copies_only_changed_files_and_removes_stale(sync, tmp_path):
+    """A changed node copies only differing files and drops deleted ones."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "keep.js", "keep")
+    _write(web_src / "edit.js", "old")
+    _write(web_src / "old" / "gone.js", "gone")
+    sync.sync_web_files(quiet=True, hardlink=False)
+
+    _write(web_src / "edit.js", "new content")
+    (web_src / "old" / "gone.js").unlink()
+
+    stats = sync.sync_web_files(quiet=True, hardlink=False)
+    target = tmp_path / "web" / "alpha"
+    assert stats["files"] == 1
+    assert (target / "edit.js").read_text() == "new content"
+    assert (target / "keep.js").read_text() == "keep"
+    assert not (target / "old").exists()
+
+
+def test_strict_hash_catches_edits_that_keep_mtime(sync, tmp_path, monkeypatch):
+    """--strict-hash reads every file, so an edit with a restored mtime is still synced."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "same.js", "same")
+    _write(web_src / "edit.js", "old")
+    sync.sync_web_files(quiet=True, hardlink=False, strict_hash=True)
+
+    hashed = []
+    file_digest = sync._file_digest
+    monkeypatch.setattr(sync, "_file_digest", lambda path: hashed.append(path) or file_digest(path))
+    st = (web_src / "edit.js").stat()
+    _write(web_src / "edit.js", "new")
+    os.utime(web_src / "edit.js", ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    stats = sync.sync_web_files(quiet=True, hardlink=False, strict_hash=True)
+    assert sorted(Path(p).name for p in hashed) == ["edit.js", "same.js"]
+    assert stats["files"] == 1
+    assert (tmp_path / "web" / "alpha" / "edit.js").read_text() == "new"
+
+
+def test_default_mode_catches_size_change_with_restored_mtime(sync, tmp_path):
+    """The tree-signature shortcut includes total size, not just mtimes and count."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "edit.js", "old")
+    sync.sync_web_files(quiet=True, hardlink=False)
+
+    st = (web_src / "edit.js").stat()
+    _write(web_src / "edit.js", "new content")
+    os.utime(web_src / "edit.js", ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    stats = sync.sync_web_files(quiet=True, hardlink=False)
+    assert not stats["cached"]
+    assert (tmp_path / "web" / "alpha" / "edit.js").read_text() == "new content"
+
+
+def test_sync_default_mode_reads_no_file_contents(sync, tmp_path, monkeypatch):
+    """The default size/mtime fingerprint detects edits without hashing any file."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "edit.js", "old")
+
+    hashed = []
+    monkeypatch.setattr(sync, "_file_digest", lambda path: hashed.append(path))
+    sync.sync_web_files(quiet=True, hardlink=False)
+    _write(web_src / "edit.js", "new content")
+
+    stats = sync.sync_web_files(quiet=True, hardlink=False)
+    assert hashed == []
+    assert stats["files"] == 1
+    assert (tmp_path / "web" / "alpha" / "edit.js").read_text() == "new content"
+
+
+def test_sync_detects_rename_with_unchanged_mtime(sync, tmp_path):
+    """Renaming a file keeps its mtime and the file count, but still resyncs."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "a.js", "a")
+    _write(web_src / "b.js", "b")
+    sync.sync_web_files(quiet=True)
+
+    (web_src / "a.js").rename(web_src / "c.js")
+
+    stats = sync.sync_web_files(quiet=True)
+    target = tmp_path / "web" / "alpha"
+    assert not stats["cached"]
+    assert (target / "c.js").read_text() == "a"
+    assert not (target / "a.js").exists()
+
+
+def test_sync_detects_rename_of_directory_without_js_files(sync, tmp_path):
+    """Renaming a nested directory resyncs even if its parent holds no .js file."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "a" / "b" / "c" / "x.js", "x")
+    sync.sync_web_files(quiet=True)
+
+    (web_src / "a" / "b" / "c").rename(web_src / "a" / "b" / "d")
+
+    stats = sync.sync_web_files(quiet=True)
+    target = tmp_path / "web" / "alpha" / "a" / "b"
+    assert not stats["cached"]
+    assert (target / "d" / "x.js").read_text() == "x"
+    assert not (target / "c").exists()
+
+
+def test_sync_hardlinks_or_copies(sync, tmp_path):
+    """Files are hardlinked by default; --no-hardlink produces independent copies."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "main.js", "main")
+    target = tmp_path / "web" / "alpha" / "main.js"
+
+    sync.sync_web_files(quiet=True)
+    assert target.samefile(web_src / "main.js")
+
+    sync.sync_web_files(force=True, quiet=True, hardlink=False)
+    assert not target.samefile(web_src / "main.js")
+    assert target.read_text() == "main"
+
+
+def test_sync_skips_matching_targets_without_cache(sync, tmp_path):
+    """Targets with the source's size and mtime are kept even if the cache is lost."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "main.js", "main")
+    _write(web_src / "utils" / "helper.js", "helper")
+    sync.sync_web_files(quiet=True, hardlink=False)
+
+    (tmp_path / "web" / ".sync_hashes.json").unlink()
+    stats = sync.sync_web_files(quiet=True, hardlink=False)
+    assert not stats["cached"]
+    assert stats["files"] == 0
+
+
+def test_sync_retries_node_after_failed_copy(sync, tmp_path, monkeypatch, capsys):
+    """A failed copy is reported, and its node is not cached so the next run retries it."""
+    web_src = tmp_path / "nodes" / "alpha" / "web"
+    _write(web_src / "main.js", "main")
+    _write(tmp_path / "web_src" / "core" / "core.js", "core")
+
+    link_or_copy = sync._link_or_copy
+
+    def fail_main(src, dst, *args):
+        if str(dst).endswith("main.js"):
+            raise OSError("disk full")
+        return link_or_copy(src, dst, *args)
+
+    monkeypatch.setattr(sync, "_link_or_copy", fail_main)
+    stats = sync.sync_web_files(quiet=True)
+    assert stats["failed"] == 1
+    assert "[WARN] 1 file(s) failed to sync for: alpha" in capsys.readouterr().out
+    assert (tmp_path / "web" / "core" / "core.js").read_text() == "core"
+    assert not (tmp_path / "web" / "alpha" / "main.js").exists()
+
+    monkeypatch.setattr(sync, "_link_or_copy", link_or_copy)
+    stats = sync.sync_web_files(quiet=True)
+    assert stats["nodes"] == 1
+    assert stats["failed"] == 0
+    assert (tmp_path / "web" / "alpha" / "main.js").read_text() == "main"